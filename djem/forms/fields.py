@@ -1,6 +1,6 @@
 from django import forms
 
-from djem.utils.dt import TIMEZONE_CHOICES, get_tz_helper
+from djem.utils.dt import TIMEZONE_CHOICES, TIMEZONE_NAMES, get_tz_helper
 
 
 # Based on django-timezone-field
@@ -19,3 +19,26 @@ class TimeZoneField(forms.TypedChoiceField):
         defaults.update(kwargs)
         
         super().__init__(*args, **defaults)
+    
+    @property
+    def choices(self):
+        
+        return super().choices
+    
+    @choices.setter
+    def choices(self, value):
+        
+        forms.TypedChoiceField.choices.fset(self, value)
+        
+        # When using the default choices, validate against a set of timezone
+        # names rather than scanning the full list of choices. Choices are
+        # normalised into a new list when set, so this needs to be determined
+        # here, where the original value is still available.
+        self._valid_names = TIMEZONE_NAMES if value is TIMEZONE_CHOICES else None
+    
+    def valid_value(self, value):
+        
+        if self._valid_names is not None:
+            return str(value) in self._valid_names
+        
+        return super().valid_value(value)
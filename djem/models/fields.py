@@ -1,6 +1,6 @@
 from django.db import models
 
-from djem.utils.dt import TIMEZONE_CHOICES, get_tz_helper
+from djem.utils.dt import TIMEZONE_CHOICES, TIMEZONE_NAMES, get_tz_helper
 
 __all__ = ('TimeZoneField', )
 
@@ -71,6 +71,10 @@ class TimeZoneField(models.Field):
     
     def get_prep_value(self, value):
         
+        # Common timezone names are known to be valid, and can be used as-is
+        if isinstance(value, str) and value in TIMEZONE_NAMES:
+            return value
+        
         # Convert to timezone string, ensuring it is a valid timezone
         helper = get_tz_helper(value)
         
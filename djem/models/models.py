@@ -1,6 +1,5 @@
 import re
 import warnings
-from collections import OrderedDict
 
 from django.conf import settings
 from django.contrib.auth.models import _user_has_perm
@@ -67,6 +66,10 @@ class UnarchivedCollector(Collector):
 
 class _TaggableStr(str):
     
+    # Avoid a per-instance __dict__, since an instance is created for every
+    # line of every log
+    __slots__ = ('tags', )
+    
     def __new__(cls, value, tags=None):
         
         obj = super().__new__(cls, value)
@@ -77,6 +80,12 @@ class _TaggableStr(str):
         
         return obj
     
+    def __reduce__(self):
+        
+        # Without a __dict__, the default reduction can't preserve tags under
+        # the older pickle protocols, so reconstruct via __new__() directly
+        return (self.__class__, (str(self), self.tags))
+    
     def __repr__(self):
         
         output = super().__repr__()
@@ -99,8 +108,19 @@ class Loggable:
     
     def __init__(self, *args, **kwargs):
         
-        self._active_logs = OrderedDict()
-        self._finished_logs = OrderedDict()
+        # Active logs are stacked in the order they were started, relying on
+        # the insertion order of a regular dict. The most recently started
+        # one is the current log, which is also referenced directly so that it
+        # can be appended to without looking it up.
+        self._active_logs = {}
+        self._current_log = None
+        
+        # Finished logs are kept in the order they were finished, relying on
+        # the insertion order of a regular dict
+        self._finished_logs = {}
+        
+        # Finished logs cannot be modified, so their string forms can be cached
+        self._joined_logs = {}
         
         super().__init__(*args, **kwargs)
     
@@ -116,7 +136,16 @@ class Loggable:
         if name in self._active_logs:
             raise ValueError(f'A log named "{name}" is already active.')
         
-        self._active_logs[name] = []
+        self._current_log = self._active_logs[name] = []
+    
+    def _reactivate_log(self):
+        
+        # Make the most recently started of the remaining active logs, if any,
+        # the current log
+        if self._active_logs:
+            self._current_log = self._active_logs[next(reversed(self._active_logs))]
+        else:
+            self._current_log = None
     
     def end_log(self):
         """
@@ -134,20 +163,23 @@ class Loggable:
         :return: A ``(name, log)`` tuple.
         """
         
-        # Pop from active logs to move to finished logs
-        try:
-            name, log = self._active_logs.popitem()
-        except KeyError:
+        if not self._active_logs:
             raise KeyError('No active log to finish.')
         
+        # Pop from active logs to move to finished logs
+        name, log = self._active_logs.popitem()
+        
+        self._reactivate_log()
+        
         # If a log with the same name has been finished previously, remove it
         # from the finished logs dict before adding this one, so that this one
-        # is added to the "end" of the ordered dict.
-        if name in self._finished_logs:
-            self._finished_logs.pop(name)
-        
+        # is added to the "end" of the dict.
+        self._finished_logs.pop(name, None)
         self._finished_logs[name] = log
         
+        # Any string form cached for a previous log of the same name is stale
+        self._joined_logs.pop(name, None)
+        
         return name, log.copy()
     
     def discard_log(self):
@@ -155,10 +187,12 @@ class Loggable:
         Discard the currently active log. Reactivate the previous log, if any.
         """
         
-        try:
-            self._active_logs.popitem()
-        except KeyError:
+        if not self._active_logs:
             raise KeyError('No active log to discard.')
+        
+        self._active_logs.popitem()
+        
+        self._reactivate_log()
     
     def log(self, *lines, tag=None):
         """
@@ -170,19 +204,39 @@ class Loggable:
         :param tag: A tag to apply to each line.
         """
         
-        # Pop to get the last item
-        try:
-            name, log = self._active_logs.popitem()
-        except KeyError:
+        log = self._current_log
+        
+        if log is None:
             raise KeyError('No active log to append to. Has one been started?')
         
-        # Append to the log
+        # Append all lines to the log at once
         tags = (tag, ) if tag else None
-        for line in lines:
-            log.append(_TaggableStr(line, tags=tags))
+        log.extend([_TaggableStr(line, tags=tags) for line in lines])
+    
+    def is_logging(self):
+        """
+        Return ``True`` if there is an active log that can be appended to,
+        otherwise return ``False``. Useful for skipping the construction of
+        log entries that would otherwise be expensive to build, or that would
+        have nowhere to go.
         
-        # Put back in the active logs dict
-        self._active_logs[name] = log
+        :return: ``True`` if there is an active log, ``False`` otherwise.
+        """
+        
+        return self._current_log is not None
+    
+    def _get_finished_log(self, name, log, tags, raw):
+        
+        # Filtered and raw logs are always processed afresh, but the full
+        # string form is only built once
+        if tags or raw:
+            return _process_log(log, tags, raw)
+        
+        try:
+            return self._joined_logs[name]
+        except KeyError:
+            joined = self._joined_logs[name] = '\n'.join(log)
+            return joined
     
     def get_log(self, name, tags=None, raw=False):
         """
@@ -203,12 +257,12 @@ class Loggable:
         :return: The log, either as a string or a list.
         """
         
-        try:
-            log = self._finished_logs[name]
-        except KeyError:
+        log = self._finished_logs.get(name)
+        
+        if log is None:
             raise KeyError(f'No log found for "{name}". Has it been finished?')
         
-        return _process_log(log, tags, raw)
+        return self._get_finished_log(name, log, tags, raw)
     
     def get_last_log(self, tags=None, raw=False):
         """
@@ -227,15 +281,13 @@ class Loggable:
         :return: The log, either as a string or a list.
         """
         
-        # Pop to get the last item, but put it straight back
-        try:
-            name, log = self._finished_logs.popitem()
-        except KeyError:
+        if not self._finished_logs:
             raise KeyError('No finished logs to retrieve.')
         
-        self._finished_logs[name] = log
+        # Read the last item without removing it
+        name, log = next(reversed(self._finished_logs.items()))
         
-        return _process_log(log, tags, raw)
+        return self._get_finished_log(name, log, tags, raw)
 
 
 class OLPMixin(Loggable):
@@ -509,6 +561,45 @@ class AuditableQuerySet(MixableQuerySet, models.QuerySet):
         
         return obj, False
     
+    def bulk_create(self, objs, *args, _user=None, **kwargs):
+        """
+        Overridden to ensure the ``user_created``, ``user_modified``,
+        ``date_created`` and ``date_modified`` fields are populated on the
+        given instances, since ``save()`` is not called on them. The ``_user``
+        keyword argument (named to reduce potential conflicts with model field
+        names, and keyword-only so Django's own positional arguments are
+        unaffected) is the user instance to populate them with. Unless the
+        :setting:`DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE` setting is ``False``,
+        it is required if any of the given instances do not already have
+        their user fields set. Existing ``user_created`` and ``date_created``
+        values are maintained.
+        """
+        
+        objs = list(objs)
+        
+        if not _user and _is_user_required():
+            if any(obj.user_created_id is None or obj.user_modified_id is None for obj in objs):
+                raise TypeError(
+                    'bulk_create() requires the "_user" keyword argument to be a user model instance, '
+                    'unless the user fields of all given instances are already set.'
+                )
+        
+        now = timezone.now()
+        
+        for obj in objs:
+            obj.date_modified = now
+            
+            if obj.date_created is None:
+                obj.date_created = now
+            
+            if _user:
+                obj.user_modified = _user
+                
+                if obj.user_created_id is None:
+                    obj.user_created = _user
+        
+        return super().bulk_create(objs, *args, **kwargs)
+    
     def owned_by(self, user):
         """
         Return a queryset of records "owned" by the given user, as per the
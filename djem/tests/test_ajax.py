@@ -5,7 +5,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.http import HttpResponse
 from django.template.defaultfilters import mark_safe
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, SimpleTestCase, TestCase
 
 from djem.ajax import AjaxResponse, ajax_login_required
 from djem.utils.tests import MessagingRequestFactory
@@ -53,11 +53,28 @@ class AjaxLoginRequiredTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
 
 
-class AjaxResponseTestCase(TestCase):
+class AjaxResponseTestCase(SimpleTestCase):
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        
+        super().setUpClass()
         
-        self.factory = MessagingRequestFactory()
+        # The factory holds no per-request state, so share it between tests
+        cls.factory = MessagingRequestFactory()
+    
+    def get_data(self, view):
+        """
+        Call the given view with a simple GET request, verify the response was
+        successful, and return its decoded JSON content.
+        """
+        
+        request = self.factory.get('/test/')
+        response = view(request)
+        
+        self.assertEqual(response.status_code, 200)
+        
+        return json.loads(response.content)
     
     def test_response__no_args(self):
         """
@@ -84,11 +101,9 @@ class AjaxResponseTestCase(TestCase):
             
             return AjaxResponse(r)
         
-        request = self.factory.get('/test/')
-        response = view(request)
+        data = self.get_data(view)
         
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(json.loads(response.content.decode()), {})
+        self.assertEqual(data, {})
     
     def test_response__data(self):
         """
@@ -100,14 +115,9 @@ class AjaxResponseTestCase(TestCase):
             
             return AjaxResponse(r, {'test': 'test'})
         
-        request = self.factory.get('/test/')
-        response = view(request)
+        data = self.get_data(view)
         
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.content.decode())
-        self.assertEqual(len(data), 1)
-        self.assertEqual(data['test'], 'test')
+        self.assertDictEqual(data, {'test': 'test'})
     
     def test_response__bad_data(self):
         """
@@ -134,14 +144,9 @@ class AjaxResponseTestCase(TestCase):
             
             return AjaxResponse(r, success=True)
         
-        request = self.factory.get('/test/')
-        response = view(request)
+        data = self.get_data(view)
         
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.content.decode())
-        self.assertEqual(len(data), 1)
-        self.assertIs(data['success'], True)
+        self.assertDictEqual(data, {'success': True})
     
     def test_response__success__false(self):
         """
@@ -153,14 +158,9 @@ class AjaxResponseTestCase(TestCase):
             
             return AjaxResponse(r, success=False)
         
-        request = self.factory.get('/test/')
-        response = view(request)
-        
-        self.assertEqual(response.status_code, 200)
+        data = self.get_data(view)
         
-        data = json.loads(response.content.decode())
-        self.assertEqual(len(data), 1)
-        self.assertIs(data['success'], False)
+        self.assertDictEqual(data, {'success': False})
     
     def test_response__success__dumb(self):
         """
@@ -172,14 +172,9 @@ class AjaxResponseTestCase(TestCase):
             
             return AjaxResponse(r, success='dumb')
         
-        request = self.factory.get('/test/')
-        response = view(request)
-        
-        self.assertEqual(response.status_code, 200)
+        data = self.get_data(view)
         
-        data = json.loads(response.content.decode())
-        self.assertEqual(len(data), 1)
-        self.assertIs(data['success'], True)
+        self.assertDictEqual(data, {'success': True})
     
     def test_response__success__data(self):
         """
@@ -191,15 +186,9 @@ class AjaxResponseTestCase(TestCase):
             
             return AjaxResponse(r, {'test': 'test'}, success=True)
         
-        request = self.factory.get('/test/')
-        response = view(request)
+        data = self.get_data(view)
         
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.content.decode())
-        self.assertEqual(len(data), 2)
-        self.assertEqual(data['test'], 'test')
-        self.assertIs(data['success'], True)
+        self.assertDictEqual(data, {'test': 'test', 'success': True})
     
     def test_response__messages(self):
         """
@@ -209,32 +198,21 @@ class AjaxResponseTestCase(TestCase):
         
         def view(r):
             
-            messages.success(request, 'This is a success message.')
-            messages.error(request, 'This is an error message.')
-            messages.add_message(request, messages.INFO, 'This is an info message.', extra_tags='special')
+            messages.success(r, 'This is a success message.')
+            messages.error(r, 'This is an error message.')
+            messages.add_message(r, messages.INFO, 'This is an info message.', extra_tags='special')
             
             return AjaxResponse(r)
         
-        request = self.factory.get('/test/')
-        response = view(request)
-        
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.content.decode())
-        self.assertEqual(len(data), 1)
-        self.assertEqual(len(data['messages']), 3)
+        data = self.get_data(view)
         
-        success = data['messages'][0]
-        self.assertEqual(success['message'], 'This is a success message.')
-        self.assertEqual(success['tags'], 'success')
-        
-        error = data['messages'][1]
-        self.assertEqual(error['message'], 'This is an error message.')
-        self.assertEqual(error['tags'], 'error')
-        
-        info = data['messages'][2]
-        self.assertEqual(info['message'], 'This is an info message.')
-        self.assertEqual(info['tags'], 'special info')
+        self.assertDictEqual(data, {
+            'messages': [
+                {'message': 'This is a success message.', 'tags': 'success'},
+                {'message': 'This is an error message.', 'tags': 'error'},
+                {'message': 'This is an info message.', 'tags': 'special info'},
+            ]
+        })
     
     def test_response__messages__xss(self):
         """
@@ -249,17 +227,14 @@ class AjaxResponseTestCase(TestCase):
             
             return AjaxResponse(r)
         
-        request = self.factory.get('/test/')
-        response = view(request)
-        
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.content.decode())
-        self.assertEqual(len(data), 1)
-        self.assertEqual(len(data['messages']), 2)
+        data = self.get_data(view)
         
-        self.assertEqual(data['messages'][0]['message'], 'This is a message &lt;em&gt;with bad HTML&lt;/em&gt;.')
-        self.assertEqual(data['messages'][1]['message'], 'This is a message <em>with safe HTML</em>.')
+        self.assertDictEqual(data, {
+            'messages': [
+                {'message': 'This is a message &lt;em&gt;with bad HTML&lt;/em&gt;.', 'tags': 'error'},
+                {'message': 'This is a message <em>with safe HTML</em>.', 'tags': 'success'},
+            ]
+        })
     
     def test_response__messages__data(self):
         """
@@ -269,20 +244,15 @@ class AjaxResponseTestCase(TestCase):
         
         def view(r):
             
-            messages.success(request, 'This is a success message.')
+            messages.success(r, 'This is a success message.')
             
             return AjaxResponse(r, {'test': 'test'})
         
-        request = self.factory.get('/test/')
-        response = view(request)
-        
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.content.decode())
-        self.assertEqual(len(data), 2)
-        self.assertEqual(len(data['messages']), 1)
-        self.assertEqual(data['test'], 'test')
+        data = self.get_data(view)
         
-        success = data['messages'][0]
-        self.assertEqual(success['message'], 'This is a success message.')
-        self.assertEqual(success['tags'], 'success')
+        self.assertDictEqual(data, {
+            'test': 'test',
+            'messages': [
+                {'message': 'This is a success message.', 'tags': 'success'},
+            ]
+        })
@@ -32,9 +32,11 @@ class _TestView(PermissionRequiredMixin, View):
 @override_settings(AUTH_USER_MODEL='djemtest.CustomUser', AUTHENTICATION_BACKENDS=_backends)
 class OLPMixinTestCase(TestCase):
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         
-        self.user = CustomUser.objects.create_user('test.user')
+        cls.user = CustomUser.objects.create_user('test.user')
+        cls.olp_log_permission = Permission.objects.get(codename='olp_log')
     
     def test_clear_perm_cache__no_checks(self):
         """
@@ -233,7 +235,7 @@ class OLPMixinTestCase(TestCase):
         
         # Grant the user the model-level permission so that object-level checks
         # are performed
-        user.user_permissions.add(Permission.objects.get(codename='olp_log'))
+        user.user_permissions.add(self.olp_log_permission)
         
         obj = UserLogTest.objects.create()
         
@@ -267,7 +269,7 @@ class OLPMixinTestCase(TestCase):
         
         user = self.user
         user.is_superuser = True
-        user.save()
+        user.save(update_fields=['is_superuser'])
         
         user.has_perm('djemtest.mlp_log')
         
@@ -293,7 +295,7 @@ class OLPMixinTestCase(TestCase):
         
         user = self.user
         user.is_superuser = True
-        user.save()
+        user.save(update_fields=['is_superuser'])
         
         obj = UserLogTest.objects.create()
         
@@ -322,7 +324,7 @@ class OLPMixinTestCase(TestCase):
         
         user = self.user
         user.is_superuser = True
-        user.save()
+        user.save(update_fields=['is_superuser'])
         
         user.has_perm('djemtest.mlp_log')
         
@@ -348,7 +350,7 @@ class OLPMixinTestCase(TestCase):
         
         user = self.user
         user.is_superuser = True
-        user.save()
+        user.save(update_fields=['is_superuser'])
         
         obj = UserLogTest.objects.create()
         
@@ -412,7 +414,7 @@ class OLPMixinTestCase(TestCase):
         
         # Grant the user the model-level permission so that object-level checks
         # are performed
-        user.user_permissions.add(Permission.objects.get(codename='olp_log'))
+        user.user_permissions.add(self.olp_log_permission)
         
         obj = UserLogTest.objects.create()
         
@@ -450,7 +452,7 @@ class OLPMixinTestCase(TestCase):
         
         user = self.user
         user.is_superuser = True
-        user.save()
+        user.save(update_fields=['is_superuser'])
         
         user.has_perm('djemtest.mlp_log')
         
@@ -479,7 +481,7 @@ class OLPMixinTestCase(TestCase):
         
         user = self.user
         user.is_superuser = True
-        user.save()
+        user.save(update_fields=['is_superuser'])
         
         obj = UserLogTest.objects.create()
         
@@ -512,7 +514,7 @@ class OLPMixinTestCase(TestCase):
         
         user = self.user
         user.is_superuser = True
-        user.save()
+        user.save(update_fields=['is_superuser'])
         
         user.has_perm('djemtest.mlp_log')
         
@@ -541,7 +543,7 @@ class OLPMixinTestCase(TestCase):
         
         user = self.user
         user.is_superuser = True
-        user.save()
+        user.save(update_fields=['is_superuser'])
         
         obj = UserLogTest.objects.create()
         
@@ -625,34 +627,53 @@ class OLPTestCase(TestCase):
     TestModel = OLPTest
     model_name = 'olptest'
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         
         group1 = Group.objects.create(name='Test Group 1')
         group2 = Group.objects.create(name='Test Group 2')
         
-        user1 = self.UserModel.objects.create_user('test1')
+        user1 = cls.UserModel.objects.create_user('test1')
         user1.groups.add(group1)
         
-        user2 = self.UserModel.objects.create_user('test2')
+        user2 = cls.UserModel.objects.create_user('test2')
         user2.groups.add(group2)
         
         # Grant both users and both groups all permissions for OLPTest, at
         # the model level (except "closed", only accessible to super users)
         permissions = Permission.objects.filter(
             content_type__app_label='djemtest',
-            content_type__model=self.model_name
-        ).exclude(codename='closed_{0}'.format(self.model_name))
+            content_type__model=cls.model_name
+        ).exclude(codename='closed_{0}'.format(cls.model_name))
+        
+        # Insert the relations for both users, and for both groups, at once
+        permission_ids = list(permissions.values_list('pk', flat=True))
+        
+        UserPermission = cls.UserModel.user_permissions.through
+        user_field = cls.UserModel.user_permissions.field.m2m_field_name()
+        UserPermission.objects.bulk_create(
+            UserPermission(**{user_field: user, 'permission_id': pk})
+            for user in (user1, user2) for pk in permission_ids
+        )
+        
+        GroupPermission = Group.permissions.through
+        GroupPermission.objects.bulk_create(
+            GroupPermission(group=group, permission_id=pk)
+            for group in (group1, group2) for pk in permission_ids
+        )
         
-        user1.user_permissions.set(permissions)
-        user2.user_permissions.set(permissions)
-        group1.permissions.set(permissions)
-        group2.permissions.set(permissions)
+        cls.user1 = user1
+        cls.user2 = user2
+        cls.group1 = group1
+        cls.group2 = group2
+        cls.all_permissions = permissions
         
-        self.user1 = user1
-        self.user2 = user2
-        self.group1 = group1
-        self.group2 = group2
-        self.all_permissions = permissions
+        # Look up the "open" permission once, for the tests that grant it to
+        # new users
+        cls.open_permission = permissions.get(codename='open_{0}'.format(cls.model_name))
+        
+        # A record with no owning user or group, for tests that don't need one
+        cls.obj = cls.TestModel.objects.create()
     
     def perm(self, perm_name):
         
@@ -687,7 +708,7 @@ class OLPTestCase(TestCase):
         
         user = self.user1
         user.set_password('blahblahblah')
-        user.save()
+        user.save(update_fields=['password'])
         
         self.assertTrue(authenticate(username='test1', password='blahblahblah'))
     
@@ -704,14 +725,14 @@ class OLPTestCase(TestCase):
         corresponding model-level permissions.
         """
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         user1 = self.UserModel.objects.create_user('useless')
         perm1 = user1.has_perm(self.perm('open'), obj)
         self.assertFalse(perm1)
         
         user2 = self.UserModel.objects.create_user('useful')
-        user2.user_permissions.add(Permission.objects.get(codename='open_{0}'.format(self.model_name)))
+        user2.user_permissions.add(self.open_permission)
         perm2 = user2.has_perm(self.perm('open'), obj)
         self.assertTrue(perm2)
     
@@ -721,15 +742,13 @@ class OLPTestCase(TestCase):
         reaching the object's permission access method.
         """
         
-        user = self.UserModel.objects.create_user('inactive')
-        user.is_active = False
-        user.save()
+        user = self.UserModel.objects.create_user('inactive', is_active=False)
         
         # Grant the user the "open" permission to ensure it is their
         # inactive-ness that denies them permission
-        user.user_permissions.add(Permission.objects.get(codename='open_{0}'.format(self.model_name)))
+        user.user_permissions.add(self.open_permission)
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         perm = user.has_perm(self.perm('open'), obj)
         
@@ -741,14 +760,12 @@ class OLPTestCase(TestCase):
         reaching the object's permission access method.
         """
         
-        user = self.UserModel.objects.create_user('super')
-        user.is_superuser = True
-        user.save()
+        user = self.UserModel.objects.create_user('super', is_superuser=True)
         
         # Deliberately do not grant the user the "open" permission to
         # ensure it is their super-ness that grants them permission
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         perm = user.has_perm(self.perm('open'), obj)
         
@@ -761,16 +778,13 @@ class OLPTestCase(TestCase):
         superuser.
         """
         
-        user = self.UserModel.objects.create_user('superinactive')
-        user.is_superuser = True
-        user.is_active = False
-        user.save()
+        user = self.UserModel.objects.create_user('superinactive', is_superuser=True, is_active=False)
         
         # Grant the user the "open" permission to ensure it is their
         # inactive-ness that denies them permission
-        user.user_permissions.add(Permission.objects.get(codename='open_{0}'.format(self.model_name)))
+        user.user_permissions.add(self.open_permission)
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         perm = user.has_perm(self.perm('open'), obj)
         
@@ -785,7 +799,7 @@ class OLPTestCase(TestCase):
         the permission).
         """
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         # Test without object
         model_perm = self.user1.has_perm(self.perm('add'))
@@ -881,7 +895,7 @@ class OLPTestCase(TestCase):
         """
         
         user = self.user1
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         user_perm_cache_name = self.cache('user', 'combined', obj)
         group_perm_cache_name = self.cache('group', 'combined', obj)
         
@@ -894,6 +908,10 @@ class OLPTestCase(TestCase):
         self.assertFalse(user._olp_cache[user_perm_cache_name])
         self.assertFalse(user._olp_cache[group_perm_cache_name])
         
+        # Test repeating the check is answered entirely from the cache
+        with self.assertNumQueries(0):
+            self.assertFalse(user.has_perm(self.perm('combined'), obj))
+        
         # Test resetting the cache
         self.cache_reset_test(user)
     
@@ -949,15 +967,13 @@ class OLPTestCase(TestCase):
         """
         
         backend = ObjectPermissionsBackend()
-        user = self.UserModel.objects.create_user('inactive')
-        user.is_active = False
-        user.save()
+        user = self.UserModel.objects.create_user('inactive', is_active=False)
         
         # Give the user all model-level permissions to ensure it is the
         # inactive-ness that denies them permission
         user.user_permissions.set(self.all_permissions)
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         perms = backend.get_user_permissions(user, obj)
         self.assertEqual(perms, set())
@@ -971,14 +987,12 @@ class OLPTestCase(TestCase):
         """
         
         backend = ObjectPermissionsBackend()
-        user = self.UserModel.objects.create_user('super')
-        user.is_superuser = True
-        user.save()
+        user = self.UserModel.objects.create_user('super', is_superuser=True)
         
         # The user deliberately does not have any model-level permissions to
         # ensure it is the super-ness that grants them permission
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         perms = backend.get_user_permissions(user, obj)
         self.assertEqual(perms, {
@@ -1003,16 +1017,13 @@ class OLPTestCase(TestCase):
         """
         
         backend = ObjectPermissionsBackend()
-        user = self.UserModel.objects.create_user('superinactive')
-        user.is_superuser = True
-        user.is_active = False
-        user.save()
+        user = self.UserModel.objects.create_user('superinactive', is_superuser=True, is_active=False)
         
         # Give the user all model-level permissions to ensure it is the
         # inactive-ness that denies them permission
         user.user_permissions.set(self.all_permissions)
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         perms = backend.get_user_permissions(user, obj)
         self.assertEqual(perms, set())
@@ -1026,7 +1037,7 @@ class OLPTestCase(TestCase):
         
         backend = ObjectPermissionsBackend()
         user = self.user1
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         expected_caches = (
             self.cache('user', 'view', obj),
@@ -1100,9 +1111,7 @@ class OLPTestCase(TestCase):
         permissions to inactive users.
         """
         
-        user = self.UserModel.objects.create_user('inactive')
-        user.is_active = False
-        user.save()
+        user = self.UserModel.objects.create_user('inactive', is_active=False)
         
         # Give the user all model-level permissions to ensure it is the
         # inactive-ness that denies them permission
@@ -1119,14 +1128,12 @@ class OLPTestCase(TestCase):
         permissions to superusers.
         """
         
-        user = self.UserModel.objects.create_user('super')
-        user.is_superuser = True
-        user.save()
+        user = self.UserModel.objects.create_user('super', is_superuser=True)
         
         # The user deliberately does not have any model-level permissions to
         # ensure it is the super-ness that grants them permission
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         self.assertEqual(user.get_all_permissions(obj), {
             self.perm('view'),
@@ -1147,10 +1154,7 @@ class OLPTestCase(TestCase):
         permissions to inactive users, even superusers.
         """
         
-        user = self.UserModel.objects.create_user('superinactive')
-        user.is_superuser = True
-        user.is_active = False
-        user.save()
+        user = self.UserModel.objects.create_user('superinactive', is_superuser=True, is_active=False)
         
         # Give the user all model-level permissions to ensure it is the
         # inactive-ness that denies them permission
@@ -1169,7 +1173,7 @@ class OLPTestCase(TestCase):
         """
         
         user = self.user1
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         expected_caches = (
             self.cache('group', 'view', obj),
@@ -1242,9 +1246,7 @@ class OLPTestCase(TestCase):
         permissions to inactive users.
         """
         
-        user = self.UserModel.objects.create_user('inactive')
-        user.is_active = False
-        user.save()
+        user = self.UserModel.objects.create_user('inactive', is_active=False)
         
         # Give the user all model-level permissions to ensure it is the
         # inactive-ness that denies them permission
@@ -1261,14 +1263,12 @@ class OLPTestCase(TestCase):
         permissions to superusers.
         """
         
-        user = self.UserModel.objects.create_user('super')
-        user.is_superuser = True
-        user.save()
+        user = self.UserModel.objects.create_user('super', is_superuser=True)
         
         # The user deliberately does not have any model-level permissions to
         # ensure it is the super-ness that grants them permission
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         self.assertEqual(user.get_all_permissions(obj), {
             self.perm('view'),
@@ -1289,10 +1289,7 @@ class OLPTestCase(TestCase):
         permissions to inactive users, even superusers.
         """
         
-        user = self.UserModel.objects.create_user('superinactive')
-        user.is_superuser = True
-        user.is_active = False
-        user.save()
+        user = self.UserModel.objects.create_user('superinactive', is_superuser=True, is_active=False)
         
         # Give the user all model-level permissions to ensure it is the
         # inactive-ness that denies them permission
@@ -1432,14 +1429,12 @@ class UniversalOLPTrueTestCase(OLPCacheMixin, OLPTestCase):
         """
         
         backend = ObjectPermissionsBackend()
-        user = self.UserModel.objects.create_user('super')
-        user.is_superuser = True
-        user.save()
+        user = self.UserModel.objects.create_user('super', is_superuser=True)
         
         # The user deliberately does not have any model-level permissions to
         # ensure it is the super-ness that grants them model-level permission
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         perms = backend.get_user_permissions(user, obj)
         self.assertEqual(perms, {
@@ -1459,14 +1454,12 @@ class UniversalOLPTrueTestCase(OLPCacheMixin, OLPTestCase):
         them explicitly).
         """
         
-        user = self.UserModel.objects.create_user('super')
-        user.is_superuser = True
-        user.save()
+        user = self.UserModel.objects.create_user('super', is_superuser=True)
         
         # The user deliberately does not have any model-level permissions to
         # ensure it is the super-ness that grants them model-level permission
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         self.assertEqual(user.get_all_permissions(obj), {
             self.perm('view'),
@@ -1485,14 +1478,12 @@ class UniversalOLPTrueTestCase(OLPCacheMixin, OLPTestCase):
         them explicitly).
         """
         
-        user = self.UserModel.objects.create_user('super')
-        user.is_superuser = True
-        user.save()
+        user = self.UserModel.objects.create_user('super', is_superuser=True)
         
         # The user deliberately does not have any model-level permissions to
         # ensure it is the super-ness that grants them model-level permission
         
-        obj = self.TestModel.objects.create()
+        obj = self.obj
         
         self.assertEqual(user.get_all_permissions(obj), {
             self.perm('view'),
@@ -1513,7 +1504,8 @@ class PermissionRequiredDecoratorTestCase(TestCase):
     # setting override is not recognised.
     #
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         
         user = get_user_model().objects.create_user('test1')
         
@@ -1527,9 +1519,12 @@ class PermissionRequiredDecoratorTestCase(TestCase):
         
         user.user_permissions.set(permissions)
         
-        self.user = user
-        self.olptest_with_access = OLPTest.objects.create(user=user)
-        self.olptest_without_access = OLPTest.objects.create()
+        cls.user = user
+        cls.olptest_with_access = OLPTest.objects.create(user=user)
+        cls.olptest_without_access = OLPTest.objects.create()
+    
+    def setUp(self):
+        
         self.factory = RequestFactory()
         self.resolved_login_url = resolve_url(settings.LOGIN_URL)
     
@@ -1958,7 +1953,8 @@ class PermissionRequiredMixinTestCase(TestCase):
     # setting override is not recognised.
     #
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         
         user = get_user_model().objects.create_user('test1')
         
@@ -1972,9 +1968,12 @@ class PermissionRequiredMixinTestCase(TestCase):
         
         user.user_permissions.set(permissions)
         
-        self.user = user
-        self.olptest_with_access = OLPTest.objects.create(user=user)
-        self.olptest_without_access = OLPTest.objects.create()
+        cls.user = user
+        cls.olptest_with_access = OLPTest.objects.create(user=user)
+        cls.olptest_without_access = OLPTest.objects.create()
+    
+    def setUp(self):
+        
         self.factory = RequestFactory()
         self.resolved_login_url = resolve_url(settings.LOGIN_URL)
     
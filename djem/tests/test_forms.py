@@ -331,3 +331,24 @@ class TimeZoneFieldFormTestCase(TestCase):
         self.assertEqual(form.errors['timezone'], [
             'Select a valid choice. Australia/Sydney is not one of the available choices.'
         ])
+    
+    def test_custom_choices__reassigned(self):
+        """
+        Test a Form with a TimeZoneField whose choices are narrowed after the
+        field is constructed correctly rejects timezones that are no longer
+        available, and accepts those that are.
+        """
+        
+        form = TimeZoneFieldTestForm2({'timezone': 'US/Eastern'})
+        form.fields['timezone'].choices = [('Australia/Sydney', 'Australia/Sydney')]
+        
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors['timezone'], [
+            'Select a valid choice. US/Eastern is not one of the available choices.'
+        ])
+        
+        form = TimeZoneFieldTestForm2({'timezone': 'Australia/Sydney'})
+        form.fields['timezone'].choices = [('Australia/Sydney', 'Australia/Sydney')]
+        
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['timezone'].name, 'Australia/Sydney')
@@ -1,10 +1,28 @@
 from django.contrib import messages
 from django.contrib.messages import constants
+from django.contrib.messages.middleware import MessageMiddleware as DjangoMessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
 from django.http import HttpRequest, HttpResponse
-from django.test import Client, TestCase, override_settings
-from django.urls import path
+from django.test import RequestFactory, SimpleTestCase
 
-from djem.middleware import MemoryStorage
+from djem.middleware import MemoryStorage, MessageMiddleware
+
+# Response prefixes for standard and AJAX requests, indexed by whether or not
+# the request is an AJAX request
+PREFIXES = ('STANDARD', 'AJAX')
+
+# Middleware to wrap test views in, outermost first
+DJEM_MIDDLEWARE = (SessionMiddleware, MessageMiddleware)
+DJANGO_MIDDLEWARE = (SessionMiddleware, DjangoMessageMiddleware)
+
+# Expected content of responses from add_message_view
+STANDARD_NO_MESSAGES = b'STANDARD: no messages'
+AJAX_NO_MESSAGES = b'AJAX: no messages'
+
+
+def _get_prefix(request):
+    
+    return PREFIXES[request.headers.get('x-requested-with') == 'XMLHttpRequest']
 
 
 def add_message_view(request):
@@ -12,69 +30,53 @@ def add_message_view(request):
     msg = request.GET['msg']
     messages.info(request, msg)
     
-    if request.headers.get('x-requested-with') == 'XMLHttpRequest':
-        prefix = 'AJAX'
-    else:
-        prefix = 'STANDARD'
+    prefix = _get_prefix(request)
     
-    return HttpResponse('{0}: no messages'.format(prefix))
+    return HttpResponse(f'{prefix}: no messages')
 
 
 def add_read_message_view(request):
     
-    msg = request.GET['msg']
-    messages.info(request, msg)
+    # Add to and read back from the same store
+    store = messages.get_messages(request)
+    store.add(constants.INFO, request.GET['msg'])
     
-    content = ', '.join([msg.message for msg in messages.get_messages(request)])
+    content = ', '.join(m.message for m in store)
     
-    if request.headers.get('x-requested-with') == 'XMLHttpRequest':
-        prefix = 'AJAX'
-    else:
-        prefix = 'STANDARD'
+    prefix = _get_prefix(request)
     
-    return HttpResponse('{0}: {1}'.format(prefix, content))
-
-
-urlpatterns = [
-    path('messages/add/', add_message_view),
-    path('messages/add/read/', add_read_message_view),
-]
-
+    return HttpResponse(f'{prefix}: {content}')
 
-djem_middleware_settings = override_settings(
-    ROOT_URLCONF='djem.tests.test_middleware',
-    MIDDLEWARE=[
-        'django.contrib.sessions.middleware.SessionMiddleware',
-        'djem.middleware.MessageMiddleware'
-    ]
-)
 
-django_middleware_settings = override_settings(
-    ROOT_URLCONF='djem.tests.test_middleware',
-    MIDDLEWARE=[
-        'django.contrib.sessions.middleware.SessionMiddleware',
-        'django.contrib.messages.middleware.MessageMiddleware'
-    ]
-)
-
-
-class MemoryStorageTestCase(TestCase):
+class MemoryStorageTestCase(SimpleTestCase):
     
     def test_add(self):
         """
         Test messages can be added and retrieved as expected.
         """
         
+        for count in range(3):
+            with self.subTest(count=count):
+                # Create a message store with a fake request instance
+                messages = MemoryStorage(HttpRequest())
+                
+                for i in range(count):
+                    messages.add(constants.INFO, f'Test message {i}')
+                
+                self.assertEqual(len(messages), count)
+                self.assertEqual(len(list(messages)), count)
+    
+    def test_add__after_read(self):
+        """
+        Test messages can be added after the store has been read, without
+        affecting the messages that were already read.
+        """
+        
         # Create a message store with a fake request instance
         messages = MemoryStorage(HttpRequest())
         
-        self.assertEqual(len(messages), 0)
-        
         messages.add(constants.INFO, 'Test message')
-        self.assertEqual(len(messages), 1)
-        
         messages.add(constants.INFO, 'Another test message')
-        self.assertEqual(len(messages), 2)
         
         # Read the message store
         message_list = list(messages)
@@ -85,42 +87,55 @@ class MemoryStorageTestCase(TestCase):
         self.assertEqual(len(messages), 3)
 
 
-class MessageMiddlewareTestCase(TestCase):
+class MessageMiddlewareTestCase(SimpleTestCase):
     
     def setUp(self):
         
-        self.client = Client()
+        self.factory = RequestFactory()
+    
+    def get(self, view, msg, ajax=False, middleware=DJEM_MIDDLEWARE):
+        """
+        Call the given view directly with a GET request for the given message,
+        wrapped in the given middleware. Bypasses URL resolution and the rest
+        of the middleware stack. Cookies set on the response are sent with
+        subsequent requests, as they would be by the test client.
+        """
+        
+        extra = {}
+        if ajax:
+            extra['HTTP_X_REQUESTED_WITH'] = 'XMLHttpRequest'
+        
+        handler = view
+        for middleware_class in reversed(middleware):
+            handler = middleware_class(handler)
+        
+        request = self.factory.get('/', {'msg': msg}, **extra)
+        response = handler(request)
+        
+        self.factory.cookies.update(response.cookies)
+        
+        return response
     
-    @djem_middleware_settings
     def test_standard_request(self):
         """
         Test that messages added via the message framework, on a standard
         request, can be read back when using djem's MessageMiddleware.
         """
         
-        response = self.client.get(
-            '/messages/add/read/',
-            {'msg': 'test message'}
-        )
+        response = self.get(add_read_message_view, 'test message')
         
         self.assertEqual(response.content, b'STANDARD: test message')
     
-    @djem_middleware_settings
     def test_ajax_request(self):
         """
         Test that messages added via the message framework, on an AJAX
         request, can be read back when using djem's MessageMiddleware.
         """
         
-        response = self.client.get(
-            '/messages/add/read/',
-            {'msg': 'test message'},
-            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
-        )
+        response = self.get(add_read_message_view, 'test message', ajax=True)
         
         self.assertEqual(response.content, b'AJAX: test message')
     
-    @djem_middleware_settings
     def test_mixed_requests(self):
         """
         Test that messages added on standard requests and AJAX requests use
@@ -130,46 +145,31 @@ class MessageMiddlewareTestCase(TestCase):
         
         # Start with a standard request that adds a message, but doesn't read
         # back the message store
-        response = self.client.get(
-            '/messages/add/',
-            {'msg': 'first standard message'}
-        )
+        response = self.get(add_message_view, 'first standard message')
         
-        self.assertEqual(response.content, b'STANDARD: no messages')
+        self.assertEqual(response.content, STANDARD_NO_MESSAGES)
         
         # Next, trigger an AJAX request that adds a message, but also doesn't
         # read back the message store. This message should be lost once the
         # request is completed.
-        response = self.client.get(
-            '/messages/add/',
-            {'msg': 'lost ajax message'},
-            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
-        )
+        response = self.get(add_message_view, 'lost ajax message', ajax=True)
         
-        self.assertEqual(response.content, b'AJAX: no messages')
+        self.assertEqual(response.content, AJAX_NO_MESSAGES)
         
         # Then trigger an AJAX request that adds a message and does read back
         # the message store - it should only see the message it added, not
         # either of the two previous messages.
-        response = self.client.get(
-            '/messages/add/read/',
-            {'msg': 'ajax message'},
-            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
-        )
+        response = self.get(add_read_message_view, 'ajax message', ajax=True)
         
         self.assertEqual(response.content, b'AJAX: ajax message')
         
         # Finally, trigger another standard request that adds a message and
         # reads back the message store - it should see the two messages added
         # as part of standard requests, and not those added in the AJAX request
-        response = self.client.get(
-            '/messages/add/read/',
-            {'msg': 'second standard message'}
-        )
+        response = self.get(add_read_message_view, 'second standard message')
         
         self.assertEqual(response.content, b'STANDARD: first standard message, second standard message')
     
-    @django_middleware_settings
     def test_django_mixed_requests(self):
         """
         Test that messages added on standard requests and AJAX requests DO
@@ -178,29 +178,19 @@ class MessageMiddlewareTestCase(TestCase):
         
         # Start with a standard request that adds a message, but doesn't read
         # back the message store
-        response = self.client.get(
-            '/messages/add/',
-            {'msg': 'first standard message'}
-        )
+        response = self.get(add_message_view, 'first standard message', middleware=DJANGO_MIDDLEWARE)
         
-        self.assertEqual(response.content, b'STANDARD: no messages')
+        self.assertEqual(response.content, STANDARD_NO_MESSAGES)
         
         # Then trigger an AJAX request that adds a message and does read back
         # the message store - it sees all messages
-        response = self.client.get(
-            '/messages/add/read/',
-            {'msg': 'ajax message'},
-            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
-        )
+        response = self.get(add_read_message_view, 'ajax message', ajax=True, middleware=DJANGO_MIDDLEWARE)
         
         self.assertEqual(response.content, b'AJAX: first standard message, ajax message')
         
         # Finally, trigger another standard request that adds a message and
         # reads back the message store - it only sees its own message, since
         # the others were consumed by the intervening AJAX request
-        response = self.client.get(
-            '/messages/add/read/',
-            {'msg': 'second standard message'}
-        )
+        response = self.get(add_read_message_view, 'second standard message', middleware=DJANGO_MIDDLEWARE)
         
         self.assertEqual(response.content, b'STANDARD: second standard message')
@@ -1,11 +1,13 @@
+import copy
 import datetime
+import pickle
 import warnings
 from zoneinfo import ZoneInfo
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
-from django.db.models import ProtectedError, QuerySet, RestrictedError
+from django.db.models import Count, Max, ProtectedError, Q, QuerySet, RestrictedError
 from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils import timezone
 
@@ -18,10 +20,36 @@ from .models import (
     StaticTest, TimeZoneTest, VersionableTest
 )
 
+User = get_user_model()
+
+ONE_DAY = datetime.timedelta(days=1)
+FIVE_DAYS = datetime.timedelta(days=5)
+
+
+def make_users(*usernames):
+    
+    users = [User(username=username) for username in usernames]
+    
+    # No tests authenticate these users, so give them an unusable password
+    # and avoid the cost of hashing one
+    for user in users:
+        user.set_unusable_password()
+    
+    # Insert all users in a single query
+    User.objects.bulk_create(users)
+    
+    # Primary keys are not set on bulk created instances by all backends (e.g.
+    # SQLite prior to Django 4.0), in which case fetch the users back
+    if users[0].pk is None:
+        users_by_name = User.objects.in_bulk(usernames, field_name='username')
+        users = [users_by_name[username] for username in usernames]
+    
+    return users
+
 
 def make_user(username):
     
-    return get_user_model().objects.create_user(username, 'fakepassword')
+    return make_users(username)[0]
 
 
 class UnarchivedCollectorTestCase(TestCase):
@@ -95,6 +123,24 @@ class TaggableStrTestCase(SimpleTestCase):
         
         self.assertEqual(str(obj), 'test')
         self.assertEqual(repr(obj), "'test', tags=tag1,tag2")
+    
+    def test_copy(self):
+        
+        obj = copy.deepcopy(_TaggableStr('test', ['tag1', 'tag2']))
+        
+        self.assertIsInstance(obj, _TaggableStr)
+        self.assertEqual(obj, 'test')
+        self.assertEqual(obj.tags, ('tag1', 'tag2'))
+    
+    def test_pickle(self):
+        
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                obj = pickle.loads(pickle.dumps(_TaggableStr('test', ['tag1', 'tag2']), protocol))
+                
+                self.assertIsInstance(obj, _TaggableStr)
+                self.assertEqual(obj, 'test')
+                self.assertEqual(obj.tags, ('tag1', 'tag2'))
 
 
 class CommonInfoMixinTestCase(TestCase):
@@ -286,10 +332,22 @@ class AuditableTestCase(TestCase):
     
     model = AuditableTest
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         
-        self.user1 = make_user('test')
-        self.user2 = make_user('test2')
+        cls.user1, cls.user2 = make_users('test', 'test2')
+    
+    def get_modified(self, user):
+        """
+        Return the number of records last modified by the given user, and the
+        most recent ``date_modified`` value across all records, using a single
+        query.
+        """
+        
+        return self.model.objects.aggregate(
+            count=Count('pk', filter=Q(user_modified=user)),
+            latest=Max('date_modified')
+        )
     
     # Model
     
@@ -333,42 +391,35 @@ class AuditableTestCase(TestCase):
             with self.assertRaises(IntegrityError):
                 obj.save()
     
-    def test_object_create__user__required(self):
+    def test_object_create__user(self):
         """
         Test the overridden ``save`` method automatically sets the necessary
-        fields when creating a new instance, using the given ``user`` argument.
-        """
-        
-        obj = self.model()
-        
-        with self.assertNumQueries(1):
-            obj.save(self.user1)
-        
-        # Test the object attributes are updated
-        self.assertEqual(obj.user_created_id, self.user1.pk)
-        self.assertEqual(obj.user_created_id, obj.user_modified_id)
-        
-        self.assertIsNotNone(obj.date_created)
-        self.assertEqual(obj.date_created, obj.date_modified)
-        
-        # Test the changes are correctly written to the database
-        obj.refresh_from_db()
-        
-        self.assertEqual(obj.user_created_id, self.user1.pk)
-        self.assertEqual(obj.user_created_id, obj.user_modified_id)
-        
-        self.assertIsNotNone(obj.date_created)
-        self.assertEqual(obj.date_created, obj.date_modified)
-    
-    def test_object_create__user__not_required(self):
-        """
-        Test the overridden ``save`` method automatically sets the necessary
-        fields when creating a new instance, using the given ``user`` argument
-        even when it is not required.
-        """
-        
-        with self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False):
-            self.test_object_create__user__required()
+        fields when creating a new instance, using the given ``user`` argument,
+        whether or not it is required.
+        """
+        
+        for required in (True, False):
+            with self.subTest(required=required), self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=required):
+                obj = self.model()
+                
+                with self.assertNumQueries(1):
+                    obj.save(self.user1)
+                
+                # Test the object attributes are updated
+                self.assertEqual(obj.user_created_id, self.user1.pk)
+                self.assertEqual(obj.user_created_id, obj.user_modified_id)
+                
+                self.assertIsNotNone(obj.date_created)
+                self.assertEqual(obj.date_created, obj.date_modified)
+                
+                # Test the changes are correctly written to the database
+                obj.refresh_from_db(fields=['user_created', 'user_modified', 'date_created', 'date_modified'])
+                
+                self.assertEqual(obj.user_created_id, self.user1.pk)
+                self.assertEqual(obj.user_created_id, obj.user_modified_id)
+                
+                self.assertIsNotNone(obj.date_created)
+                self.assertEqual(obj.date_created, obj.date_modified)
     
     def test_object_create__no_user(self):
         """
@@ -392,7 +443,7 @@ class AuditableTestCase(TestCase):
         self.assertEqual(obj.date_created, obj.date_modified)
         
         # Test the changes are correctly written to the database
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['user_created', 'user_modified', 'date_created', 'date_modified'])
         
         self.assertEqual(obj.user_created_id, user.pk)
         self.assertEqual(obj.user_created_id, obj.user_modified_id)
@@ -406,7 +457,7 @@ class AuditableTestCase(TestCase):
         if one already exists when creating a new instance.
         """
         
-        d = timezone.now() - datetime.timedelta(days=5)
+        d = timezone.now() - FIVE_DAYS
         
         obj = self.model(date_created=d)
         
@@ -417,7 +468,7 @@ class AuditableTestCase(TestCase):
         self.assertEqual(obj.date_created, d)
         
         # Test the changes are correctly written to the database
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['date_created'])
         self.assertEqual(obj.date_created, d)
     
     def test_object_create__existing_user_created(self):
@@ -436,65 +487,61 @@ class AuditableTestCase(TestCase):
         self.assertEqual(obj.user_modified_id, self.user1.pk)
         
         # Test the changes are correctly written to the database
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['user_created', 'user_modified'])
         self.assertEqual(obj.user_created_id, self.user2.pk)
         self.assertEqual(obj.user_modified_id, self.user1.pk)
     
-    def test_object_update__user__required(self):
+    def test_object_update__user(self):
         """
         Test the overridden ``save`` method automatically sets the necessary
         fields when updating an existing instance, using the given ``user``
-        argument.
-        """
-        
-        obj1 = self.model()
-        obj1.save(self.user1)
-        
-        self.assertEqual(obj1.user_created_id, self.user1.pk)
-        self.assertEqual(obj1.user_modified_id, self.user1.pk)
-        self.assertTrue(obj1.field1)
-        self.assertTrue(obj1.field2)
-        
-        # Modify some fields on a separate instance of the same record. The
-        # user_modified should be saved, the date modified should be updated,
-        # "field1" should be saved (listed in update_fields), "field2" should
-        # NOT be saved (not listed in update_fields)
-        obj2 = self.model.objects.get(pk=obj1.pk)
-        obj2.field1 = False
-        obj2.field2 = False
-        
-        with self.assertNumQueries(1):
-            obj2.save(self.user2, update_fields=('field1',))
-        
-        # Test the object attributes are updated
-        self.assertEqual(obj2.user_created_id, self.user1.pk)
-        self.assertEqual(obj2.user_modified_id, self.user2.pk)
-        self.assertFalse(obj2.field1)
-        self.assertFalse(obj2.field2)
-        
-        self.assertEqual(obj2.date_created, obj1.date_created)
-        self.assertGreater(obj2.date_modified, obj1.date_modified)
-        
-        # Test the changes are correctly written to the database
-        obj2.refresh_from_db()
-        
-        self.assertEqual(obj2.user_created_id, self.user1.pk)
-        self.assertEqual(obj2.user_modified_id, self.user2.pk)
-        self.assertFalse(obj2.field1)
-        self.assertTrue(obj2.field2)
-        
-        self.assertEqual(obj2.date_created, obj1.date_created)
-        self.assertGreater(obj2.date_modified, obj1.date_modified)
-    
-    def test_object_update__user__not_required(self):
-        """
-        Test the overridden ``save`` method automatically sets the necessary
-        fields when updating an existing instance, using the given ``user``
-        argument even when it is not required.
-        """
-        
-        with self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False):
-            self.test_object_update__user__required()
+        argument, whether or not it is required.
+        """
+        
+        for required in (True, False):
+            with self.subTest(required=required), self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=required):
+                obj1 = self.model()
+                obj1.save(self.user1)
+                
+                self.assertEqual(obj1.user_created_id, self.user1.pk)
+                self.assertEqual(obj1.user_modified_id, self.user1.pk)
+                self.assertTrue(obj1.field1)
+                self.assertTrue(obj1.field2)
+                
+                # Modify some fields on a separate instance of the same record. The
+                # user_modified should be saved, the date modified should be updated,
+                # "field1" should be saved (listed in update_fields), "field2" should
+                # NOT be saved (not listed in update_fields)
+                obj2 = self.model.objects.only(
+                    'user_created', 'user_modified', 'date_created', 'date_modified', 'field1', 'field2'
+                ).get(pk=obj1.pk)
+                obj2.field1 = False
+                obj2.field2 = False
+                
+                with self.assertNumQueries(1):
+                    obj2.save(self.user2, update_fields=('field1',))
+                
+                # Test the object attributes are updated
+                self.assertEqual(obj2.user_created_id, self.user1.pk)
+                self.assertEqual(obj2.user_modified_id, self.user2.pk)
+                self.assertFalse(obj2.field1)
+                self.assertFalse(obj2.field2)
+                
+                self.assertEqual(obj2.date_created, obj1.date_created)
+                self.assertGreater(obj2.date_modified, obj1.date_modified)
+                
+                # Test the changes are correctly written to the database
+                obj2.refresh_from_db(fields=[
+                    'user_created', 'user_modified', 'date_created', 'date_modified', 'field1', 'field2'
+                ])
+                
+                self.assertEqual(obj2.user_created_id, self.user1.pk)
+                self.assertEqual(obj2.user_modified_id, self.user2.pk)
+                self.assertFalse(obj2.field1)
+                self.assertTrue(obj2.field2)
+                
+                self.assertEqual(obj2.date_created, obj1.date_created)
+                self.assertGreater(obj2.date_modified, obj1.date_modified)
     
     def test_object_update__no_user(self):
         """
@@ -513,7 +560,9 @@ class AuditableTestCase(TestCase):
         self.assertTrue(obj1.field1)
         self.assertTrue(obj1.field2)
         
-        obj2 = self.model.objects.get(pk=obj1.pk)
+        obj2 = self.model.objects.only(
+            'user_created', 'user_modified', 'date_created', 'date_modified', 'field1', 'field2'
+        ).get(pk=obj1.pk)
         obj2.field1 = False
         obj2.field2 = False
         
@@ -531,7 +580,9 @@ class AuditableTestCase(TestCase):
         self.assertGreater(obj2.date_modified, obj1.date_modified)
         
         # Test the changes are correctly written to the database
-        obj2.refresh_from_db()
+        obj2.refresh_from_db(fields=[
+            'user_created', 'user_modified', 'date_created', 'date_modified', 'field1', 'field2'
+        ])
         
         self.assertEqual(obj2.user_created_id, user.pk)
         self.assertEqual(obj2.user_modified_id, user.pk)
@@ -546,11 +597,10 @@ class AuditableTestCase(TestCase):
         Test the ``owned_by`` method of a model instance.
         """
         
-        obj1 = self.model()
-        obj1.save(self.user1)
-        
-        obj2 = self.model()
-        obj2.save(self.user2)
+        # owned_by() only compares against user_created, so the records do not
+        # need to be saved
+        obj1 = self.model(user_created=self.user1)
+        obj2 = self.model(user_created=self.user2)
         
         with self.assertNumQueries(0):
             self.assertTrue(obj1.owned_by(self.user1))
@@ -563,43 +613,33 @@ class AuditableTestCase(TestCase):
     
     # Queryset
     
-    def test_queryset_create__user__required(self):
-        """
-        Test the overridden ``create`` method of the custom queryset passes
-        the given user through to the underlying ``save()`` call.
-        """
-        
-        self.assertEqual(self.model.objects.count(), 0)
-        
-        user = self.user1
-        
-        with self.assertNumQueries(1):
-            obj = self.model.objects.all().create(user)
-        
-        self.assertEqual(self.model.objects.count(), 1)
-        self.assertEqual(obj.user_created_id, user.pk)
-        self.assertEqual(obj.user_modified_id, user.pk)
-    
-    def test_queryset_create__user__not_required(self):
+    def test_queryset_create__user(self):
         """
-        Test the overridden ``create`` method of the custom queryset passes
-        the given user through to the underlying ``save()`` call, even when it
-        is not required.
+        Test the overridden ``create`` method of the custom queryset passes the
+        given user through to the underlying ``save()`` call, whether or not it
+        is required (including as per the old
+        ``DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE`` setting).
         """
         
-        with self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_create__user__required()
-    
-    def test_queryset_create__user__not_required__old_setting(self):
-        """
-        Test the overridden ``create`` method of the custom queryset passes
-        the given user through to the underlying ``save()`` call, even when it
-        is not required as per the old ``DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE``
-        setting.
-        """
+        overrides = (
+            {},
+            {'DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE': False},
+            {'DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE': False},
+        )
         
-        with self.settings(DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_create__user__required()
+        for override in overrides:
+            with self.subTest(**override), self.settings(**override):
+                # Start each iteration with an empty table
+                self.model.objects.all().delete()
+                
+                user = self.user1
+                
+                with self.assertNumQueries(1):
+                    obj = self.model.objects.all().create(user)
+                
+                self.assertEqual(self.model.objects.count(), 1)
+                self.assertEqual(obj.user_created_id, user.pk)
+                self.assertEqual(obj.user_modified_id, user.pk)
     
     def test_queryset_create__no_user__required(self):
         """
@@ -629,115 +669,106 @@ class AuditableTestCase(TestCase):
         
         self.assertEqual(self.model.objects.count(), 1)
     
-    def test_queryset_get_or_create__get__user__required(self):
-        """
-        Test the overridden ``get_or_create`` method of the custom queryset
-        correctly retrieves the expected record when it exists, irrespective
-        of the given ``user`` argument.
-        """
-        
-        obj = self.model()
-        obj.save(self.user1)
-        date_modified = obj.date_modified
-        
-        with self.assertNumQueries(1):
-            obj, created = self.model.objects.all().get_or_create(None, self.user2, field1=True)
-        
-        self.assertFalse(created)
-        
-        # Object should not be modified, only retrieved
-        self.assertEqual(obj.user_modified_id, self.user1.pk)
-        self.assertEqual(obj.date_modified, date_modified)
-    
-    def test_queryset_get_or_create__get__user__not_required(self):
+    def test_queryset_get_or_create__get__user(self):
         """
         Test the overridden ``get_or_create`` method of the custom queryset
-        correctly retrieves the expected record when it exists, irrespective
-        of the given ``user`` argument.
+        correctly retrieves the expected record when it exists, irrespective of
+        the given ``user`` argument, whether or not it is required.
         """
         
-        with self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_get_or_create__get__user__required()
-    
-    def test_queryset_get_or_create__get__no_user__required(self):
-        """
-        Test the overridden ``get_or_create`` method of the custom queryset
-        correctly retrieves the expected record when it exists, irrespective
-        of the given ``user`` argument.
-        """
-        
-        obj = self.model()
-        obj.save(self.user1)
-        date_modified = obj.date_modified
-        
-        with self.assertNumQueries(1):
-            obj, created = self.model.objects.all().get_or_create(field1=True)
-        
-        self.assertFalse(created)
-        
-        # Object should not be modified, only retrieved
-        self.assertEqual(obj.user_modified_id, self.user1.pk)
-        self.assertEqual(obj.date_modified, date_modified)
-    
-    def test_queryset_get_or_create__get__no_user__not_required(self):
-        """
-        Test the overridden ``get_or_create`` method of the custom queryset
-        correctly retrieves the expected record when it exists, irrespective
-        of the given ``user`` argument.
-        """
+        overrides = (
+            {},
+            {'DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE': False},
+        )
         
-        with self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_get_or_create__get__no_user__required()
-    
-    def test_queryset_get_or_create__create__user__required(self):
+        for override in overrides:
+            with self.subTest(**override), self.settings(**override):
+                # Start each iteration with an empty table
+                self.model.objects.all().delete()
+                
+                obj = self.model()
+                obj.save(self.user1)
+                date_modified = obj.date_modified
+                
+                with self.assertNumQueries(1):
+                    obj, created = self.model.objects.all().get_or_create(None, self.user2, field1=True)
+                
+                self.assertFalse(created)
+                
+                # Object should not be modified, only retrieved
+                self.assertEqual(obj.user_modified_id, self.user1.pk)
+                self.assertEqual(obj.date_modified, date_modified)
+    
+    def test_queryset_get_or_create__get__no_user(self):
         """
         Test the overridden ``get_or_create`` method of the custom queryset
-        passes the given user through to ``create()`` when there is no
-        existing record.
+        correctly retrieves the expected record when it exists, without a
+        ``user`` argument, whether or not one is required.
         """
         
-        user = self.user1
-        
-        # Create a record that doesn't match the lookup
-        obj = self.model(field1=True)
-        obj.save(self.user1)
-        
-        self.assertEqual(self.model.objects.count(), 1)
-        
-        # Queries include the initial lookup, the insert, plus two additional
-        # queries for setting and releasing the savepoint used to handle
-        # potential get/create race conditions
-        with self.assertNumQueries(4):
-            obj, created = self.model.objects.all().get_or_create(None, user, field1=False)
-        
-        self.assertTrue(created)
+        overrides = (
+            {},
+            {'DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE': False},
+        )
         
-        self.assertEqual(self.model.objects.count(), 2)
-        self.assertEqual(obj.user_created_id, user.pk)
-        self.assertEqual(obj.user_modified_id, user.pk)
-        self.assertFalse(obj.field1)
-        self.assertTrue(obj.field2)  # uses model default value
-    
-    def test_queryset_get_or_create__create__user__not_required(self):
+        for override in overrides:
+            with self.subTest(**override), self.settings(**override):
+                # Start each iteration with an empty table
+                self.model.objects.all().delete()
+                
+                obj = self.model()
+                obj.save(self.user1)
+                date_modified = obj.date_modified
+                
+                with self.assertNumQueries(1):
+                    obj, created = self.model.objects.all().get_or_create(field1=True)
+                
+                self.assertFalse(created)
+                
+                # Object should not be modified, only retrieved
+                self.assertEqual(obj.user_modified_id, self.user1.pk)
+                self.assertEqual(obj.date_modified, date_modified)
+    
+    def test_queryset_get_or_create__create__user(self):
         """
         Test the overridden ``get_or_create`` method of the custom queryset
-        passes the given user through to ``create()`` when there is no
-        existing record, even when it is not required.
+        passes the given user through to ``create()`` when there is no existing
+        record, whether or not it is required (including as per the old
+        ``DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE`` setting).
         """
         
-        with self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_get_or_create__create__user__required()
-    
-    def test_queryset_get_or_create__create__user__not_required__old_setting(self):
-        """
-        Test the overridden ``get_or_create`` method of the custom queryset
-        passes the given user through to ``create()`` when there is no
-        existing record, even when it is not required as per the old
-        ``DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE`` setting.
-        """
+        overrides = (
+            {},
+            {'DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE': False},
+            {'DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE': False},
+        )
         
-        with self.settings(DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_get_or_create__create__user__required()
+        for override in overrides:
+            with self.subTest(**override), self.settings(**override):
+                # Start each iteration with an empty table
+                self.model.objects.all().delete()
+                
+                user = self.user1
+                
+                # Create a record that doesn't match the lookup
+                obj = self.model(field1=True)
+                obj.save(self.user1)
+                
+                self.assertEqual(self.model.objects.count(), 1)
+                
+                # Queries include the initial lookup, the insert, plus two additional
+                # queries for setting and releasing the savepoint used to handle
+                # potential get/create race conditions
+                with self.assertNumQueries(4):
+                    obj, created = self.model.objects.all().get_or_create(None, user, field1=False)
+                
+                self.assertTrue(created)
+                
+                self.assertEqual(self.model.objects.count(), 2)
+                self.assertEqual(obj.user_created_id, user.pk)
+                self.assertEqual(obj.user_modified_id, user.pk)
+                self.assertFalse(obj.field1)
+                self.assertTrue(obj.field2)  # uses model default value
     
     def test_queryset_get_or_create__create__user__defaults(self):
         """
@@ -841,45 +872,38 @@ class AuditableTestCase(TestCase):
         self.assertEqual(obj.user_created_id, user.pk)
         self.assertEqual(obj.user_modified_id, user.pk)
     
-    def test_queryset_update__user__required(self):
-        """
-        Test the overridden ``update`` method of the custom queryset
-        automatically sets the necessary fields when updating existing records,
-        using the given ``user`` argument.
-        """
-        
-        obj = self.model()
-        obj.save(self.user1)
-        date_modified = obj.date_modified
-        
-        self.assertEqual(self.model.objects.filter(user_modified=self.user1).count(), 1)
-        
-        with self.assertNumQueries(1):
-            self.model.objects.all().update(self.user2, field1=False)
-        
-        self.assertEqual(self.model.objects.filter(user_modified=self.user2).count(), 1)
-        self.assertGreater(self.model.objects.first().date_modified, date_modified)
-    
-    def test_queryset_update__user__not_required(self):
+    def test_queryset_update__user(self):
         """
         Test the overridden ``update`` method of the custom queryset
         automatically sets the necessary fields when updating existing records,
-        using the given ``user`` argument even when it is not required.
+        using the given ``user`` argument, whether or not it is required
+        (including as per the old ``DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE``
+        setting).
         """
         
-        with self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_update__user__required()
-    
-    def test_queryset_update__user__not_required__old_setting(self):
-        """
-        Test the overridden ``update`` method of the custom queryset
-        automatically sets the necessary fields when updating existing records,
-        using the given ``user`` argument even when it is not required as per
-        the old ``DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE`` setting.
-        """
+        overrides = (
+            {},
+            {'DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE': False},
+            {'DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE': False},
+        )
         
-        with self.settings(DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_update__user__required()
+        for override in overrides:
+            with self.subTest(**override), self.settings(**override):
+                # Start each iteration with an empty table
+                self.model.objects.all().delete()
+                
+                obj = self.model()
+                obj.save(self.user1)
+                date_modified = obj.date_modified
+                
+                self.assertEqual(self.model.objects.filter(user_modified=self.user1).count(), 1)
+                
+                with self.assertNumQueries(1):
+                    self.model.objects.all().update(self.user2, field1=False)
+                
+                modified = self.get_modified(self.user2)
+                self.assertEqual(modified['count'], 1)
+                self.assertGreater(modified['latest'], date_modified)
     
     def test_queryset_update__no_user__required(self):
         """
@@ -913,8 +937,9 @@ class AuditableTestCase(TestCase):
             with self.assertNumQueries(1):
                 self.model.objects.all().update(field1=False)
         
-        self.assertEqual(self.model.objects.filter(user_modified=user).count(), 1)
-        self.assertGreater(self.model.objects.first().date_modified, date_modified)
+        modified = self.get_modified(user)
+        self.assertEqual(modified['count'], 1)
+        self.assertGreater(modified['latest'], date_modified)
     
     def test_queryset_update__explicit_date_modified(self):
         """
@@ -926,47 +951,49 @@ class AuditableTestCase(TestCase):
         obj.save(self.user1)
         date_modified = obj.date_modified
         
-        new_date = date_modified - timezone.timedelta(days=1)
+        new_date = date_modified - ONE_DAY
         
         with self.assertNumQueries(1):
             self.model.objects.all().update(self.user2, date_modified=new_date)
         
-        self.assertEqual(self.model.objects.first().date_modified, new_date)
+        self.assertEqual(self.model.objects.values_list('date_modified', flat=True).first(), new_date)
     
-    def test_queryset_update_or_create__update__user__required(self):
+    def test_queryset_update_or_create__update__user(self):
         """
         Test the overridden ``update_or_create`` method of the custom queryset
         correctly updates the necessary fields of the expected record when it
-        exists, using the given ``user`` argument.
+        exists, using the given ``user`` argument, whether or not it is
+        required.
         """
         
-        obj = self.model()
-        obj.save(self.user1)
-        date_modified = obj.date_modified
-        
-        self.assertEqual(self.model.objects.filter(user_modified=self.user1).count(), 1)
-        
-        # Queries include the initial lookup, the update/save, plus two
-        # additional queries for setting and releasing the savepoint used
-        # to handle potential race conditions
-        with self.assertNumQueries(4):
-            obj, created = self.model.objects.all().update_or_create(None, self.user2, field1=True)
-        
-        self.assertFalse(created)
-        
-        # Record should be updated
-        self.assertEqual(self.model.objects.filter(user_modified=self.user2).count(), 1)
-        self.assertGreater(self.model.objects.first().date_modified, date_modified)
-    
-    def test_queryset_update_or_create__update__user__not_required(self):
-        """
-        Test the overridden ``update_or_create`` method of the custom queryset
-        correctly retrieves the expected record when it exists, irrespective
-        of the given ``user`` argument.
-        """
+        overrides = (
+            {},
+            {'DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE': False},
+        )
         
-        with self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_update_or_create__update__user__required()
+        for override in overrides:
+            with self.subTest(**override), self.settings(**override):
+                # Start each iteration with an empty table
+                self.model.objects.all().delete()
+                
+                obj = self.model()
+                obj.save(self.user1)
+                date_modified = obj.date_modified
+                
+                self.assertEqual(self.model.objects.filter(user_modified=self.user1).count(), 1)
+                
+                # Queries include the initial lookup, the update/save, plus two
+                # additional queries for setting and releasing the savepoint used
+                # to handle potential race conditions
+                with self.assertNumQueries(4):
+                    obj, created = self.model.objects.all().update_or_create(None, self.user2, field1=True)
+                
+                self.assertFalse(created)
+                
+                # Record should be updated
+                modified = self.get_modified(self.user2)
+                self.assertEqual(modified['count'], 1)
+                self.assertGreater(modified['latest'], date_modified)
     
     def test_queryset_update_or_create__update__no_user__required(self):
         """
@@ -1006,58 +1033,50 @@ class AuditableTestCase(TestCase):
         self.assertFalse(created)
         
         # `date_modified` should be updated even if `user_modified` is not
-        self.assertEqual(self.model.objects.filter(user_modified=self.user1).count(), 1)
-        self.assertGreater(self.model.objects.first().date_modified, date_modified)
-    
-    def test_queryset_update_or_create__create__user__required(self):
-        """
-        Test the overridden ``update_or_create`` method of the custom queryset
-        passes the given user through to ``create()`` when there is no
-        existing record.
-        """
-        
-        user = self.user1
-        
-        # Create a record that doesn't match the lookup
-        obj = self.model(field1=True)
-        obj.save(self.user1)
-        
-        self.assertEqual(self.model.objects.count(), 1)
-        
-        # Queries include the initial lookup, the insert, plus four additional
-        # queries for setting and releasing savepoints used to handle potential
-        # race conditions
-        with self.assertNumQueries(6):
-            obj, created = self.model.objects.all().update_or_create(None, user, field1=False)
-        
-        self.assertTrue(created)
-        
-        self.assertEqual(self.model.objects.count(), 2)
-        self.assertEqual(obj.user_created_id, user.pk)
-        self.assertEqual(obj.user_modified_id, user.pk)
-        self.assertFalse(obj.field1)
-        self.assertTrue(obj.field2)  # uses model default value
+        modified = self.get_modified(self.user1)
+        self.assertEqual(modified['count'], 1)
+        self.assertGreater(modified['latest'], date_modified)
     
-    def test_queryset_update_or_create__create__user__not_required(self):
+    def test_queryset_update_or_create__create__user(self):
         """
         Test the overridden ``update_or_create`` method of the custom queryset
-        passes the given user through to ``create()`` when there is no
-        existing record, even when it is not required.
+        passes the given user through to ``create()`` when there is no existing
+        record, whether or not it is required (including as per the old
+        ``DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE`` setting).
         """
         
-        with self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_update_or_create__create__user__required()
-    
-    def test_queryset_update_or_create__create__user__not_required__old_setting(self):
-        """
-        Test the overridden ``update_or_create`` method of the custom queryset
-        passes the given user through to ``create()`` when there is no
-        existing record, even when it is not required as per the old
-        ``DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE`` setting.
-        """
+        overrides = (
+            {},
+            {'DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE': False},
+            {'DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE': False},
+        )
         
-        with self.settings(DJEM_COMMON_INFO_REQUIRE_USER_ON_SAVE=False):
-            self.test_queryset_update_or_create__create__user__required()
+        for override in overrides:
+            with self.subTest(**override), self.settings(**override):
+                # Start each iteration with an empty table
+                self.model.objects.all().delete()
+                
+                user = self.user1
+                
+                # Create a record that doesn't match the lookup
+                obj = self.model(field1=True)
+                obj.save(self.user1)
+                
+                self.assertEqual(self.model.objects.count(), 1)
+                
+                # Queries include the initial lookup, the insert, plus four additional
+                # queries for setting and releasing savepoints used to handle potential
+                # race conditions
+                with self.assertNumQueries(6):
+                    obj, created = self.model.objects.all().update_or_create(None, user, field1=False)
+                
+                self.assertTrue(created)
+                
+                self.assertEqual(self.model.objects.count(), 2)
+                self.assertEqual(obj.user_created_id, user.pk)
+                self.assertEqual(obj.user_modified_id, user.pk)
+                self.assertFalse(obj.field1)
+                self.assertTrue(obj.field2)  # uses model default value
     
     def test_queryset_update_or_create__create__user__defaults(self):
         """
@@ -1157,13 +1176,139 @@ class AuditableTestCase(TestCase):
         self.assertEqual(obj.user_created_id, user.pk)
         self.assertEqual(obj.user_modified_id, user.pk)
     
+    def test_queryset_bulk_create__user(self):
+        """
+        Test the overridden ``bulk_create`` method of the custom queryset
+        populates the user and date fields of the given instances, using the
+        given ``user`` argument, whether or not it is required.
+        """
+        
+        user = self.user1
+        
+        for required in (True, False):
+            with self.subTest(required=required), self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=required):
+                # Start each iteration with an empty table
+                self.model.objects.all().delete()
+                
+                with self.assertNumQueries(1):
+                    objs = self.model.objects.all().bulk_create([self.model(), self.model()], _user=user)
+                
+                self.assertEqual(self.model.objects.count(), 2)
+                
+                for obj in objs:
+                    self.assertEqual(obj.user_created_id, user.pk)
+                    self.assertEqual(obj.user_modified_id, user.pk)
+                    self.assertIsNotNone(obj.date_created)
+                    self.assertEqual(obj.date_created, obj.date_modified)
+                
+                self.assertEqual(self.model.objects.filter(user_created=user, user_modified=user).count(), 2)
+    
+    def test_queryset_bulk_create__positional_args(self):
+        """
+        Test the overridden ``bulk_create`` method of the custom queryset
+        passes positional arguments through to Django's ``bulk_create``, rather
+        than treating them as the user.
+        """
+        
+        user = self.user1
+        
+        # Using a batch size of 1 inserts each instance separately
+        with self.assertNumQueries(2):
+            self.model.objects.all().bulk_create([self.model(), self.model()], 1, _user=user)
+        
+        self.assertEqual(self.model.objects.filter(user_created=user, user_modified=user).count(), 2)
+    
+    def test_queryset_bulk_create__no_user__required(self):
+        """
+        Test the overridden ``bulk_create`` method of the custom queryset when
+        the required ``user`` argument is not provided. It should raise
+        TypeError.
+        """
+        
+        with self.assertNumQueries(0):
+            with self.assertRaises(TypeError):
+                self.model.objects.all().bulk_create([self.model()])
+    
+    def test_queryset_bulk_create__no_user__required__user_fields_set(self):
+        """
+        Test the overridden ``bulk_create`` method of the custom queryset
+        accepts no ``user`` argument, even when it is required, if the user
+        fields of all given instances are already set. Only the date fields
+        should be populated.
+        """
+        
+        user = self.user1
+        
+        with self.assertNumQueries(1):
+            objs = self.model.objects.all().bulk_create([
+                self.model(user_created=user, user_modified=user),
+                self.model(user_created=self.user2, user_modified=user)
+            ])
+        
+        self.assertEqual(self.model.objects.count(), 2)
+        self.assertEqual(self.model.objects.filter(user_created=self.user2, user_modified=user).count(), 1)
+        
+        for obj in objs:
+            self.assertIsNotNone(obj.date_created)
+            self.assertEqual(obj.date_created, obj.date_modified)
+        
+        # Any instance without its user fields set still requires the argument
+        with self.assertNumQueries(0):
+            with self.assertRaises(TypeError):
+                self.model.objects.all().bulk_create([
+                    self.model(user_created=user, user_modified=user),
+                    self.model(user_created=user)
+                ])
+    
+    def test_queryset_bulk_create__no_user__not_required(self):
+        """
+        Test the overridden ``bulk_create`` method of the custom queryset
+        populates only the date fields of the given instances when no user is
+        provided and it is flagged as not required.
+        """
+        
+        user = self.user1
+        
+        with self.settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False):
+            with self.assertNumQueries(1):
+                # No user argument used, so user-based fields must be set manually
+                objs = self.model.objects.all().bulk_create([
+                    self.model(user_created=user, user_modified=user)
+                ])
+        
+        self.assertEqual(self.model.objects.count(), 1)
+        self.assertIsNotNone(objs[0].date_created)
+        self.assertEqual(objs[0].date_created, objs[0].date_modified)
+    
+    def test_queryset_bulk_create__existing_created(self):
+        """
+        Test the overridden ``bulk_create`` method of the custom queryset
+        maintains existing ``user_created`` and ``date_created`` values on the
+        given instances.
+        """
+        
+        d = timezone.now() - FIVE_DAYS
+        
+        self.model.objects.all().bulk_create([
+            self.model(user_created=self.user2, date_created=d)
+        ], _user=self.user1)
+        
+        # Fetch the record rather than refreshing the bulk created instance,
+        # which does not have a primary key on all supported Django versions
+        obj = self.model.objects.only('user_created', 'user_modified', 'date_created', 'date_modified').get()
+        
+        self.assertEqual(obj.user_created_id, self.user2.pk)
+        self.assertEqual(obj.user_modified_id, self.user1.pk)
+        self.assertEqual(obj.date_created, d)
+        self.assertGreater(obj.date_modified, d)
+    
     def test_queryset_owned_by(self):
         """
         Test the ``owned_by`` method of the custom queryset.
         """
         
-        self.model().save(self.user1)
-        self.model().save(self.user2)
+        # Insert both records at once, with the second owned by a different user
+        self.model.objects.bulk_create([self.model(), self.model(user_created=self.user2)], _user=self.user1)
         
         self.assertEqual(self.model.objects.count(), 2)
         
@@ -1176,10 +1321,10 @@ class AuditableTestCase(TestCase):
             self.assertEqual(qs.owned_by(self.user1.pk).count(), 1)
         
         with self.assertNumQueries(1):
-            self.assertEqual(qs.filter(field1=False).owned_by(self.user1).count(), 0)
+            self.assertFalse(qs.filter(field1=False).owned_by(self.user1).exists())
         
         with self.assertNumQueries(1):
-            self.assertEqual(qs.owned_by(self.user1).owned_by(self.user2).count(), 0)
+            self.assertFalse(qs.owned_by(self.user1).owned_by(self.user2).exists())
     
     # Manager
     
@@ -1261,8 +1406,9 @@ class AuditableTestCase(TestCase):
         with self.assertNumQueries(1):
             self.model.objects.update(self.user2, field1=False)
         
-        self.assertEqual(self.model.objects.filter(user_modified=self.user2).count(), 1)
-        self.assertGreater(self.model.objects.first().date_modified, date_modified)
+        modified = self.get_modified(self.user2)
+        self.assertEqual(modified['count'], 1)
+        self.assertGreater(modified['latest'], date_modified)
     
     def test_manager_update_or_create__update(self):
         """
@@ -1319,8 +1465,8 @@ class AuditableTestCase(TestCase):
         manager.
         """
         
-        self.model().save(self.user1)
-        self.model().save(self.user2)
+        # Insert both records at once, with the second owned by a different user
+        self.model.objects.bulk_create([self.model(), self.model(user_created=self.user2)], _user=self.user1)
         
         self.assertEqual(self.model.objects.count(), 2)
         
@@ -1352,14 +1498,24 @@ class ArchivableTestCase(TestCase):
     # The tests are decorated so they don't raise an exception when calling the
     # save() method without a user argument if they are called on a model that
     # is mixed into Auditable.
+    # The number of queries performed by archive() depends on the relations
+    # other models have to the model being archived, since they need to be
+    # checked for unarchived related records, so is also defined at the class
+    # level.
     #
     
     model = ArchivableTest
+    archive_num_queries = 5
     
     def create_instance(self, **kwargs):
         
         return self.model.objects.create(**kwargs)
     
+    def create_instances(self, *kwargs_list):
+        
+        # Create all instances in a single query
+        return self.model.objects.bulk_create([self.model(**kwargs) for kwargs in kwargs_list])
+    
     @override_settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False)
     def test_object_archive__no_args(self):
         """
@@ -1375,11 +1531,12 @@ class ArchivableTestCase(TestCase):
         
         # Change the fields and archive the record - the changes to the fields
         # should not be saved
-        obj.field1 = False
-        obj.field2 = False
-        obj.archive()
+        with self.assertNumQueries(self.archive_num_queries):
+            obj.field1 = False
+            obj.field2 = False
+            obj.archive()
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['is_archived', 'field1', 'field2'])
         self.assertTrue(obj.is_archived)
         self.assertTrue(obj.field1)
         self.assertTrue(obj.field2)
@@ -1400,11 +1557,12 @@ class ArchivableTestCase(TestCase):
         
         # Change the fields and archive the record - only the to "field1" should
         # be saved
-        obj.field1 = False
-        obj.field2 = False
-        obj.archive(update_fields=('field1',))
+        with self.assertNumQueries(self.archive_num_queries):
+            obj.field1 = False
+            obj.field2 = False
+            obj.archive(update_fields=('field1',))
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['is_archived', 'field1', 'field2'])
         self.assertTrue(obj.is_archived)
         self.assertFalse(obj.field1)
         self.assertTrue(obj.field2)
@@ -1429,7 +1587,7 @@ class ArchivableTestCase(TestCase):
             obj.field2 = False
             obj.unarchive()
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['is_archived', 'field1', 'field2'])
         self.assertFalse(obj.is_archived)
         self.assertTrue(obj.field1)
         self.assertTrue(obj.field2)
@@ -1455,7 +1613,7 @@ class ArchivableTestCase(TestCase):
             obj.field2 = False
             obj.unarchive(update_fields=('field1',))
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['is_archived', 'field1', 'field2'])
         self.assertFalse(obj.is_archived)
         self.assertFalse(obj.field1)
         self.assertTrue(obj.field2)
@@ -1468,12 +1626,13 @@ class ArchivableTestCase(TestCase):
         called on the queryset.
         """
         
-        self.create_instance(is_archived=True, field1=True)
-        self.create_instance(is_archived=True, field1=True)
-        self.create_instance(is_archived=True, field1=False)
-        
-        self.create_instance(is_archived=False, field1=True)
-        self.create_instance(is_archived=False, field1=False)
+        self.create_instances(
+            {'is_archived': True, 'field1': True},
+            {'is_archived': True, 'field1': True},
+            {'is_archived': True, 'field1': False},
+            {'is_archived': False, 'field1': True},
+            {'is_archived': False, 'field1': False},
+        )
         
         with self.assertNumQueries(1):
             self.assertEqual(self.model.objects.archived().count(), 3)
@@ -1489,12 +1648,13 @@ class ArchivableTestCase(TestCase):
         when called on the queryset.
         """
         
-        self.create_instance(is_archived=True, field1=True)
-        self.create_instance(is_archived=True, field1=False)
-        
-        self.create_instance(is_archived=False, field1=True)
-        self.create_instance(is_archived=False, field1=True)
-        self.create_instance(is_archived=False, field1=False)
+        self.create_instances(
+            {'is_archived': True, 'field1': True},
+            {'is_archived': True, 'field1': False},
+            {'is_archived': False, 'field1': True},
+            {'is_archived': False, 'field1': True},
+            {'is_archived': False, 'field1': False},
+        )
         
         with self.assertNumQueries(1):
             self.assertEqual(self.model.objects.unarchived().count(), 3)
@@ -1510,18 +1670,23 @@ class RelatedArchivableTestCase(TestCase):
     are not applicable to the below subclasses of ArchivableTestCase.
     """
     
+    @classmethod
+    def setUpTestData(cls):
+        
+        cls.obj = ArchivableTest.objects.create(is_archived=False)
+    
     def test_archive__protected__archived(self):
         """
         Test the ``archive()`` method of an instance, when inbound protected
         foreign keys exist from archived records. It should allow the archival.
         """
         
-        obj = ArchivableTest.objects.create(is_archived=False)
+        obj = self.obj
         RelatedArchivableTest.objects.create(archivable_protected=obj, is_archived=True)
         
         obj.archive()
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['is_archived'])
         self.assertEqual(obj.is_archived, True)
     
     def test_archive__protected__unarchived(self):
@@ -1531,7 +1696,7 @@ class RelatedArchivableTestCase(TestCase):
         archival.
         """
         
-        obj = ArchivableTest.objects.create(is_archived=False)
+        obj = self.obj
         RelatedArchivableTest.objects.create(archivable_protected=obj, is_archived=False)
         
         msg = (
@@ -1542,7 +1707,7 @@ class RelatedArchivableTestCase(TestCase):
         with self.assertRaisesMessage(ProtectedError, msg):
             obj.archive()
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['is_archived'])
         self.assertEqual(obj.is_archived, False)
     
     def test_archive__protected__non_archivable(self):
@@ -1552,7 +1717,7 @@ class RelatedArchivableTestCase(TestCase):
         Archivable mixin). It should prevent the archival.
         """
         
-        obj = ArchivableTest.objects.create(is_archived=False)
+        obj = self.obj
         RelatedTest.objects.create(archivable_protected=obj)
         
         msg = (
@@ -1563,7 +1728,7 @@ class RelatedArchivableTestCase(TestCase):
         with self.assertRaisesMessage(ProtectedError, msg):
             obj.archive()
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['is_archived'])
         self.assertEqual(obj.is_archived, False)
     
     def test_archive__restricted__archived(self):
@@ -1572,12 +1737,12 @@ class RelatedArchivableTestCase(TestCase):
         foreign keys exist from archived records. It should allow the archival.
         """
         
-        obj = ArchivableTest.objects.create(is_archived=False)
+        obj = self.obj
         RelatedArchivableTest.objects.create(archivable_restricted=obj, is_archived=True)
         
         obj.archive()
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['is_archived'])
         self.assertEqual(obj.is_archived, True)
     
     def test_archive__restricted__unarchived(self):
@@ -1587,7 +1752,7 @@ class RelatedArchivableTestCase(TestCase):
         archival.
         """
         
-        obj = ArchivableTest.objects.create(is_archived=False)
+        obj = self.obj
         RelatedArchivableTest.objects.create(archivable_restricted=obj, is_archived=False)
         
         msg = (
@@ -1598,7 +1763,7 @@ class RelatedArchivableTestCase(TestCase):
         with self.assertRaisesMessage(RestrictedError, msg):
             obj.archive()
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['is_archived'])
         self.assertEqual(obj.is_archived, False)
     
     def test_archive__restricted__non_archivable(self):
@@ -1608,7 +1773,7 @@ class RelatedArchivableTestCase(TestCase):
         Archivable mixin). It should prevent the archival.
         """
         
-        obj = ArchivableTest.objects.create(is_archived=False)
+        obj = self.obj
         RelatedTest.objects.create(archivable_restricted=obj)
         
         msg = (
@@ -1619,7 +1784,7 @@ class RelatedArchivableTestCase(TestCase):
         with self.assertRaisesMessage(RestrictedError, msg):
             obj.archive()
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['is_archived'])
         self.assertEqual(obj.is_archived, False)
 
 
@@ -1659,7 +1824,7 @@ class VersionableTestCase(TestCase):
         self.assertTrue(obj.field2)
         
         # Test default value correctly saved to the database without increment
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['version', 'field1', 'field2'])
         self.assertEqual(obj.version, 1)
         self.assertTrue(obj.field1)
         self.assertTrue(obj.field2)
@@ -1670,7 +1835,7 @@ class VersionableTestCase(TestCase):
             obj.field2 = False
             obj.save(update_fields=('field1',))
         
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['version', 'field1', 'field2'])
         self.assertEqual(obj.version, 2)  # should be incremented
         self.assertFalse(obj.field1)      # should be modified
         self.assertTrue(obj.field2)       # should not be modified (not listed in update_fields)
@@ -1691,7 +1856,7 @@ class VersionableTestCase(TestCase):
             obj.save()  # version 3
         
         # Test incremented value correctly saved to the database
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['version'])
         self.assertEqual(obj.version, 3)
     
     @override_settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False)
@@ -1729,7 +1894,7 @@ class VersionableTestCase(TestCase):
             self.model.objects.all().update(field1=False)
         
         # Test value incremented correctly
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['version'])
         self.assertEqual(obj.version, 2)
     
     @override_settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False)
@@ -1752,7 +1917,7 @@ class VersionableTestCase(TestCase):
             self.model.objects.all().update_or_create({'field1': False}, pk=obj.pk)
         
         # Test value incremented correctly
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['version'])
         self.assertEqual(obj.version, 2)
     
     @override_settings(DJEM_AUDITABLE_REQUIRE_USER_ON_SAVE=False)
@@ -1772,13 +1937,14 @@ class VersionableTestCase(TestCase):
             self.model.objects.update(field1=False)
         
         # Test value incremented correctly
-        obj.refresh_from_db()
+        obj.refresh_from_db(fields=['version'])
         self.assertEqual(obj.version, 2)
 
 
 class StaticTestCase(AuditableTestCase, ArchivableTestCase, VersionableTestCase):
     
     model = StaticTest
+    archive_num_queries = 1
     
     def create_instance(self, **kwargs):
         
@@ -1791,13 +1957,36 @@ class StaticTestCase(AuditableTestCase, ArchivableTestCase, VersionableTestCase)
         obj.save()
         
         return obj
+    
+    def create_instances(self, *kwargs_list):
+        
+        # Use AuditableQuerySet.bulk_create() to populate the user
+        # created/modified values
+        return self.model.objects.bulk_create([self.model(**kwargs) for kwargs in kwargs_list], _user=self.user1)
 
 
 class LoggableTestCase(TestCase):
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
+        
+        cls.obj = LogTest.objects.create()
+    
+    def assertActiveLogs(self, obj, names):
+        """
+        Assert that the given instance's active logs are exactly those with
+        the given names, in the order they were started.
+        """
+        
+        self.assertEqual(list(obj._active_logs), names)
+    
+    def assertFinishedLogs(self, obj, names):
+        """
+        Assert that the given instance's finished logs are exactly those with
+        the given names, in the order they were finished.
+        """
         
-        self.obj = LogTest.objects.create()
+        self.assertEqual(list(obj._finished_logs), names)
     
     def test_start_log(self):
         """
@@ -1807,11 +1996,11 @@ class LoggableTestCase(TestCase):
         
         obj = self.obj
         
-        self.assertEqual(len(obj._active_logs), 0)
+        self.assertActiveLogs(obj, [])
         
         obj.start_log('test_log')
         
-        self.assertEqual(len(obj._active_logs), 1)
+        self.assertActiveLogs(obj, ['test_log'])
         self.assertEqual(obj._active_logs['test_log'], [])
     
     def test_start_log__nested(self):
@@ -1822,19 +2011,18 @@ class LoggableTestCase(TestCase):
         
         obj = self.obj
         
-        self.assertEqual(len(obj._active_logs), 0)
+        self.assertActiveLogs(obj, [])
         
         # Start the first log
         obj.start_log('test_log')
         
-        self.assertEqual(len(obj._active_logs), 1)
+        self.assertActiveLogs(obj, ['test_log'])
         self.assertEqual(obj._active_logs['test_log'], [])
         
         # Start a nested log
         obj.start_log('nested_log')
         
-        self.assertEqual(len(obj._active_logs), 2)
-        self.assertEqual(list(obj._active_logs.keys()), ['test_log', 'nested_log'])
+        self.assertActiveLogs(obj, ['test_log', 'nested_log'])
         self.assertEqual(obj._active_logs['nested_log'], [])
     
     def test_start_log__repeat(self):
@@ -1846,7 +2034,7 @@ class LoggableTestCase(TestCase):
         
         obj = self.obj
         
-        self.assertEqual(len(obj._active_logs), 0)
+        self.assertActiveLogs(obj, [])
         
         # Start the first log
         obj.start_log('test_log')
@@ -1866,18 +2054,18 @@ class LoggableTestCase(TestCase):
         
         obj = self.obj
         
-        self.assertEqual(len(obj._active_logs), 0)
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, [])
+        self.assertFinishedLogs(obj, [])
         
         obj.start_log('test_log')
         
-        self.assertEqual(len(obj._active_logs), 1)
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, ['test_log'])
+        self.assertFinishedLogs(obj, [])
         
         name, log = obj.end_log()
         
-        self.assertEqual(len(obj._active_logs), 0)
-        self.assertEqual(len(obj._finished_logs), 1)
+        self.assertActiveLogs(obj, [])
+        self.assertFinishedLogs(obj, ['test_log'])
         self.assertEqual(obj._finished_logs['test_log'], [])
         
         self.assertEqual(name, 'test_log')
@@ -1893,37 +2081,32 @@ class LoggableTestCase(TestCase):
         
         obj = self.obj
         
-        self.assertEqual(len(obj._active_logs), 0)
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, [])
+        self.assertFinishedLogs(obj, [])
         
         # Start the first log
         obj.start_log('test_log')
         
-        self.assertEqual(len(obj._active_logs), 1)
-        self.assertEqual(list(obj._active_logs.keys()), ['test_log'])
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, ['test_log'])
+        self.assertFinishedLogs(obj, [])
         
         # Start a nested log
         obj.start_log('nested_log')
         
-        self.assertEqual(len(obj._active_logs), 2)
-        self.assertEqual(list(obj._active_logs.keys()), ['test_log', 'nested_log'])
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, ['test_log', 'nested_log'])
+        self.assertFinishedLogs(obj, [])
         
         # End the nested log
         obj.end_log()
         
-        self.assertEqual(len(obj._active_logs), 1)
-        self.assertEqual(list(obj._active_logs.keys()), ['test_log'])
-        self.assertEqual(len(obj._finished_logs), 1)
-        self.assertEqual(list(obj._finished_logs.keys()), ['nested_log'])
+        self.assertActiveLogs(obj, ['test_log'])
+        self.assertFinishedLogs(obj, ['nested_log'])
         
         # End the first log
         obj.end_log()
         
-        self.assertEqual(len(obj._active_logs), 0)
-        self.assertEqual(len(obj._finished_logs), 2)
-        self.assertEqual(list(obj._finished_logs.keys()), ['nested_log', 'test_log'])
+        self.assertActiveLogs(obj, [])
+        self.assertFinishedLogs(obj, ['nested_log', 'test_log'])
     
     def test_end_log__unstarted(self):
         """
@@ -1942,18 +2125,18 @@ class LoggableTestCase(TestCase):
         
         obj = self.obj
         
-        self.assertEqual(len(obj._active_logs), 0)
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, [])
+        self.assertFinishedLogs(obj, [])
         
         obj.start_log('test_log')
         
-        self.assertEqual(len(obj._active_logs), 1)
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, ['test_log'])
+        self.assertFinishedLogs(obj, [])
         
         obj.discard_log()
         
-        self.assertEqual(len(obj._active_logs), 0)
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, [])
+        self.assertFinishedLogs(obj, [])
     
     def test_discard_log__nested(self):
         """
@@ -1964,36 +2147,32 @@ class LoggableTestCase(TestCase):
         
         obj = self.obj
         
-        self.assertEqual(len(obj._active_logs), 0)
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, [])
+        self.assertFinishedLogs(obj, [])
         
         # Start the first log
         obj.start_log('test_log')
         
-        self.assertEqual(len(obj._active_logs), 1)
-        self.assertEqual(list(obj._active_logs.keys()), ['test_log'])
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, ['test_log'])
+        self.assertFinishedLogs(obj, [])
         
         # Start a nested log
         obj.start_log('nested_log')
         
-        self.assertEqual(len(obj._active_logs), 2)
-        self.assertEqual(list(obj._active_logs.keys()), ['test_log', 'nested_log'])
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, ['test_log', 'nested_log'])
+        self.assertFinishedLogs(obj, [])
         
         # Discard the nested log
         obj.discard_log()
         
-        self.assertEqual(len(obj._active_logs), 1)
-        self.assertEqual(list(obj._active_logs.keys()), ['test_log'])
-        self.assertEqual(len(obj._finished_logs), 0)
+        self.assertActiveLogs(obj, ['test_log'])
+        self.assertFinishedLogs(obj, [])
         
         # End the first log
         obj.end_log()
         
-        self.assertEqual(len(obj._active_logs), 0)
-        self.assertEqual(len(obj._finished_logs), 1)
-        self.assertEqual(list(obj._finished_logs.keys()), ['test_log'])
+        self.assertActiveLogs(obj, [])
+        self.assertFinishedLogs(obj, ['test_log'])
     
     def test_discard_log__unstarted(self):
         """
@@ -2075,6 +2254,30 @@ class LoggableTestCase(TestCase):
             ["'first line 2'", "'second line 2'", "'third line 2'", "'fourth line 2', tags=error"]
         )
     
+    def test_log__discarded(self):
+        """
+        Test the log() method after a nested log has been discarded. It should
+        append the given lines to the log that was active prior to the nested
+        log being started.
+        """
+        
+        obj = self.obj
+        
+        obj.start_log('test_log')
+        obj.log('first line')
+        
+        obj.start_log('nested_log')
+        obj.log('discarded line')
+        obj.discard_log()
+        
+        obj.log('second line')
+        self.assertEqual(obj._active_logs['test_log'], ['first line', 'second line'])
+        
+        obj.end_log()
+        
+        with self.assertRaisesMessage(KeyError, 'No active log to append to. Has one been started?'):
+            obj.log('third line')
+    
     def test_log__unstarted(self):
         """
         Test the log() method when no logs have been started. It should raise
@@ -2084,6 +2287,30 @@ class LoggableTestCase(TestCase):
         with self.assertRaisesMessage(KeyError, 'No active log to append to. Has one been started?'):
             self.obj.log('first line', 'second line')
     
+    def test_is_logging(self):
+        """
+        Test the is_logging() method. It should return True only while there
+        is an active log, including when a nested log is ended or discarded.
+        """
+        
+        obj = self.obj
+        
+        self.assertFalse(obj.is_logging())
+        
+        obj.start_log('test_log')
+        self.assertTrue(obj.is_logging())
+        
+        obj.start_log('nested_log')
+        obj.end_log()
+        self.assertTrue(obj.is_logging())
+        
+        obj.start_log('nested_log')
+        obj.discard_log()
+        self.assertTrue(obj.is_logging())
+        
+        obj.end_log()
+        self.assertFalse(obj.is_logging())
+    
     def test_get_log(self):
         """
         Test the get_log() method. It should return the log entry for the named
@@ -2106,6 +2333,31 @@ class LoggableTestCase(TestCase):
         # underlying list
         self.assertIsNot(raw_log, obj._finished_logs['test_log'])
     
+    def test_get_log__cached(self):
+        """
+        Test the get_log() method returns the same string for repeated
+        retrievals of the same finished log, and a new one once a log with the
+        same name is finished again.
+        """
+        
+        obj = self.obj
+        
+        obj.start_log('test_log')
+        obj.log('first run')
+        obj.end_log()
+        
+        log = obj.get_log('test_log')
+        self.assertEqual(log, 'first run')
+        self.assertIs(obj.get_log('test_log'), log)
+        self.assertIs(obj.get_last_log(), log)
+        
+        obj.start_log('test_log')
+        obj.log('second run')
+        obj.end_log()
+        
+        self.assertEqual(obj.get_log('test_log'), 'second run')
+        self.assertEqual(obj.get_last_log(), 'second run')
+    
     def test_get_log__tag_filter(self):
         """
         Test the get_log() method when the `tags` argument is used to filter
@@ -2182,7 +2434,7 @@ class LoggableTestCase(TestCase):
         
         # Ensure all three logs are still there to retrieve again later if
         # necessary
-        self.assertEqual(len(obj._finished_logs), 3)
+        self.assertFinishedLogs(obj, ['log-1', 'log-2', 'log-3'])
         
         # Ensure the log list returned by get_last_log() is a copy of the
         # underlying list
@@ -2229,7 +2481,7 @@ class LoggableTestCase(TestCase):
         
         # Ensure all three logs are still there to retrieve again later if
         # necessary
-        self.assertEqual(len(obj._finished_logs), 3)
+        self.assertFinishedLogs(obj, ['log-1', 'log-2', 'log-3'])
         
         # Ensure the log list returned by get_last_log() is a copy of the
         # underlying list
@@ -2269,7 +2521,7 @@ class LoggableTestCase(TestCase):
         # Ensure a random log that occurs between two runs of the same log does
         # not keep the second run from being "last". i.e. when a log with the
         # same name as an earlier log is run, it should always append to the
-        # end of the OrderedDict of finished logs, not update the existing entry,
+        # end of the dict of finished logs, not update the existing entry,
         # which is potentially further back in the "list".
         obj.start_log('random_log')
         obj.log('second run')
@@ -2301,7 +2553,7 @@ class LoggableTestCase(TestCase):
         self.assertEqual(obj.get_log('nested_log'), 'third run')
 
 
-class TimeZoneFieldTestCase(TestCase):
+class TimeZoneFieldInitTestCase(SimpleTestCase):
     
     def test_init(self):
         
@@ -2338,12 +2590,45 @@ class TimeZoneFieldTestCase(TestCase):
         f = TimeZoneField('timezone')
         self.assertEqual(f.verbose_name, 'timezone')
     
+    def test_deconstruct(self):
+        
+        # Default choices and max_length should be omitted...
+        name, path, args, kwargs = TimeZoneField().deconstruct()
+        self.assertEqual(path, 'djem.models.fields.TimeZoneField')
+        self.assertEqual(kwargs, {})
+        
+        # ... including when given explicitly, as a copy of the defaults...
+        name, path, args, kwargs = TimeZoneField(choices=list(TimeZoneField.CHOICES)).deconstruct()
+        self.assertEqual(kwargs, {})
+        
+        # ... but custom values should be included
+        choices = [('Australia/Sydney', 'Australia/Sydney')]
+        name, path, args, kwargs = TimeZoneField(choices=choices, max_length=32).deconstruct()
+        self.assertEqual(kwargs, {'choices': choices, 'max_length': 32})
+        
+        # ... including when assigned after the field is constructed
+        field = TimeZoneField()
+        field.choices = choices
+        name, path, args, kwargs = field.deconstruct()
+        self.assertEqual(kwargs, {'choices': choices})
+    
     def test_default(self):
         
         o = TimeZoneTest()
         
         self.assertIsInstance(o.timezone2, TimeZoneHelper)
         self.assertEqual(o.timezone2.name, 'Australia/Sydney')
+
+
+class TimeZoneFieldTestCase(TestCase):
+    
+    def get_stored_value(self, obj, field_name):
+        """
+        Read back only the given field of the given instance's record, as
+        converted by the field.
+        """
+        
+        return TimeZoneTest.objects.values_list(field_name, flat=True).get(pk=obj.pk)
     
     def test_set__string(self):
         
@@ -2357,10 +2642,10 @@ class TimeZoneFieldTestCase(TestCase):
         self.assertEqual(o.timezone, 'Australia/Sydney')
         
         o.save()
-        o.refresh_from_db()
+        stored = self.get_stored_value(o, 'timezone')
         
-        self.assertIsInstance(o.timezone, TimeZoneHelper)
-        self.assertEqual(o.timezone.name, 'Australia/Sydney')
+        self.assertIsInstance(stored, TimeZoneHelper)
+        self.assertEqual(stored.name, 'Australia/Sydney')
     
     def test_set__string__invalid_timezone(self):
         
@@ -2400,10 +2685,10 @@ class TimeZoneFieldTestCase(TestCase):
         self.assertIs(o.timezone, datetime.timezone.utc)
         
         o.save()
-        o.refresh_from_db()
+        stored = self.get_stored_value(o, 'timezone')
         
-        self.assertIsInstance(o.timezone, TimeZoneHelper)
-        self.assertEqual(o.timezone.name, 'UTC')
+        self.assertIsInstance(stored, TimeZoneHelper)
+        self.assertEqual(stored.name, 'UTC')
     
     def test_set__timezone(self):
         
@@ -2419,10 +2704,10 @@ class TimeZoneFieldTestCase(TestCase):
         self.assertIs(o.timezone, tz)
         
         o.save()
-        o.refresh_from_db()
+        stored = self.get_stored_value(o, 'timezone')
         
-        self.assertIsInstance(o.timezone, TimeZoneHelper)
-        self.assertEqual(o.timezone.name, 'Australia/Sydney')
+        self.assertIsInstance(stored, TimeZoneHelper)
+        self.assertEqual(stored.name, 'Australia/Sydney')
     
     def test_set__helper(self):
         
@@ -2438,121 +2723,104 @@ class TimeZoneFieldTestCase(TestCase):
         self.assertIs(o.timezone, tz)
         
         o.save()
-        o.refresh_from_db()
-        
-        self.assertIsInstance(o.timezone, TimeZoneHelper)
-        self.assertEqual(o.timezone.name, 'Australia/Sydney')
-    
-    def test_set__None__null_true(self):
-        
-        o = TimeZoneTest()
-        
-        o.timezone3 = datetime.timezone.utc
-        
-        o.save()
-        o.refresh_from_db()
-        
-        self.assertIsInstance(o.timezone3, TimeZoneHelper)
-        self.assertIs(o.timezone3.tz, ZoneInfo('UTC'))
-        
-        o.timezone3 = None
-        o.save()
-        
-        # The field's python value will be None and it will be stored in the
-        # database as a null
-        self.assertIsNone(o.timezone3)
-        
-        o.refresh_from_db()
-        self.assertIsNone(o.timezone3)
-        
-        self.assertEqual(TimeZoneTest.objects.count(), 1)
-        self.assertEqual(TimeZoneTest.objects.filter(timezone3__isnull=True).count(), 1)
-    
-    def test_set__None__null_false(self):
-        
-        o = TimeZoneTest()
-        
-        o.timezone = datetime.timezone.utc
-        
-        o.save()
-        o.refresh_from_db()
-        
-        self.assertIsInstance(o.timezone, TimeZoneHelper)
-        self.assertIs(o.timezone.tz, ZoneInfo('UTC'))
-        
-        o.timezone = None
-        o.save()
-        
-        # The field's python value will be None (as opposed to a TimeZoneHelper
-        # with a timezone of the empty string), but it will be stored in the
-        # database as an empty string
-        self.assertIsNone(o.timezone)
-        
-        o.refresh_from_db()
-        self.assertIsNone(o.timezone)
-        
-        self.assertEqual(TimeZoneTest.objects.count(), 1)
-        self.assertEqual(TimeZoneTest.objects.filter(timezone__isnull=True).count(), 0)
-        self.assertEqual(TimeZoneTest.objects.filter(timezone='').count(), 1)
-    
-    def test_set__empty_string__null_true(self):
-        
-        o = TimeZoneTest()
-        
-        o.timezone3 = datetime.timezone.utc
-        
-        o.save()
-        o.refresh_from_db()
-        
-        self.assertIsInstance(o.timezone3, TimeZoneHelper)
-        self.assertIs(o.timezone3.tz, ZoneInfo('UTC'))
-        
-        o.timezone3 = ''
-        o.save()
-        
-        # The field's python value will revert to None after being read back
-        # from the database (as opposed to a TimeZoneHelper with a timezone of
-        # the empty string) and it will be stored in the database as a null
-        self.assertEqual(o.timezone3, '')
+        stored = self.get_stored_value(o, 'timezone')
         
-        o.refresh_from_db()
-        self.assertIsNone(o.timezone3)
-        
-        self.assertEqual(TimeZoneTest.objects.count(), 1)
-        self.assertEqual(TimeZoneTest.objects.filter(timezone3__isnull=True).count(), 1)
+        self.assertIsInstance(stored, TimeZoneHelper)
+        self.assertEqual(stored.name, 'Australia/Sydney')
     
-    def test_set__empty_string__null_false(self):
-        
-        o = TimeZoneTest()
-        
-        o.timezone = datetime.timezone.utc
-        
-        o.save()
-        o.refresh_from_db()
-        
-        self.assertIsInstance(o.timezone, TimeZoneHelper)
-        self.assertIs(o.timezone.tz, ZoneInfo('UTC'))
-        
-        o.timezone = ''
-        o.save()
-        
-        # The field's python value will revert to None after being read back
-        # from the database (as opposed to a TimeZoneHelper with a timezone of
-        # the empty string) and it will be stored in the database as an empty
-        # string
-        self.assertEqual(o.timezone, '')
+    def test_set__empty(self):
+        """
+        Test setting a TimeZoneField to None or an empty string. The field's
+        python value will revert to None after being read back from the
+        database (as opposed to a TimeZoneHelper with a timezone of the empty
+        string). It will be stored in the database as a null if the field
+        allows it, otherwise as an empty string.
+        """
         
-        o.refresh_from_db()
-        self.assertIsNone(o.timezone)
+        cases = (
+            # (field name, value, stored as null)
+            ('timezone3', None, True),
+            ('timezone3', '', True),
+            ('timezone', None, False),
+            ('timezone', '', False),
+        )
         
-        self.assertEqual(TimeZoneTest.objects.count(), 1)
-        self.assertEqual(TimeZoneTest.objects.filter(timezone__isnull=True).count(), 0)
-        self.assertEqual(TimeZoneTest.objects.filter(timezone='').count(), 1)
+        for field_name, value, null in cases:
+            with self.subTest(field=field_name, value=value):
+                o = TimeZoneTest()
+                
+                setattr(o, field_name, datetime.timezone.utc)
+                
+                o.save()
+                stored = self.get_stored_value(o, field_name)
+                
+                self.assertIsInstance(stored, TimeZoneHelper)
+                self.assertIs(stored.tz, ZoneInfo('UTC'))
+                
+                setattr(o, field_name, value)
+                o.save()
+                
+                # The value is left as given until read back from the database
+                self.assertEqual(getattr(o, field_name), value)
+                
+                self.assertIsNone(self.get_stored_value(o, field_name))
+                
+                # Other cases' records are still present, so only consider
+                # this one. A record matching the empty string cannot also be
+                # null, so a single lookup confirms how the value was stored.
+                if null:
+                    lookup = {f'{field_name}__isnull': True}
+                else:
+                    lookup = {field_name: ''}
+                
+                self.assertTrue(TimeZoneTest.objects.filter(pk=o.pk, **lookup).exists())
+    
+    def test_get_prep_value(self):
+        
+        f = TimeZoneTest._meta.get_field('timezone')
+        
+        # Common timezone names and other valid timezone names should be
+        # returned as-is
+        self.assertEqual(f.get_prep_value('Australia/Sydney'), 'Australia/Sydney')
+        self.assertEqual(f.get_prep_value('Etc/GMT+5'), 'Etc/GMT+5')
+        
+        # Other values should be converted to timezone names
+        self.assertEqual(f.get_prep_value(ZoneInfo('Australia/Sydney')), 'Australia/Sydney')
+        self.assertEqual(f.get_prep_value(TimeZoneHelper('Australia/Sydney')), 'Australia/Sydney')
+        
+        # Invalid timezone names should be rejected
+        with self.assertRaisesMessage(ValidationError, 'Invalid timezone "fail".'):
+            f.get_prep_value('fail')
+    
+    def test_get__independent(self):
+        """
+        Test records read from the database with the same timezone each get
+        their own TimeZoneHelper, so modifying one does not affect the others
+        or any records read later.
+        """
+        
+        TimeZoneTest.objects.bulk_create([
+            TimeZoneTest(timezone='Australia/Sydney'),
+            TimeZoneTest(timezone='Australia/Sydney'),
+        ])
+        
+        helper1, helper2 = TimeZoneTest.objects.values_list('timezone', flat=True)
+        
+        self.assertIsNot(helper1, helper2)
+        
+        helper1.tz = ZoneInfo('UTC')
+        
+        self.assertEqual(helper2.name, 'Australia/Sydney')
+        
+        helper3 = TimeZoneTest.objects.values_list('timezone', flat=True).first()
+        self.assertEqual(helper3.name, 'Australia/Sydney')
     
     def test_filter(self):
         
-        TimeZoneTest(timezone='Australia/Sydney').save()
-        TimeZoneTest(timezone='US/Eastern').save()
+        TimeZoneTest.objects.bulk_create([
+            TimeZoneTest(timezone='Australia/Sydney'),
+            TimeZoneTest(timezone='US/Eastern'),
+        ])
         
         queryset = TimeZoneTest.objects.all()
         self.assertEqual(queryset.count(), 2)
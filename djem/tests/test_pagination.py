@@ -1,23 +1,18 @@
 from django.contrib.auth import get_user_model
 from django.core.paginator import EmptyPage
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from djem.pagination import get_page
 
 from .models import AuditableTest
 
 
-class GetPageTestCase(TestCase):
+class GetPageTestCase(SimpleTestCase):
     
-    @classmethod
-    def setUpTestData(cls):
-        
-        user = get_user_model().objects.create_user('test')
-        
-        for i in range(23):
-            AuditableTest().save(user)
-        
-        cls.object_list = AuditableTest.objects.order_by('pk')
+    # get_page() works with any sequence, so paginate a simple list rather
+    # than records from the database. The tests never modify it, so it can
+    # be safely shared.
+    object_list = list(range(1, 24))
     
     def test_per_page__none(self):
         
@@ -125,3 +120,37 @@ class GetPageTestCase(TestCase):
         # Specifically ensure it is not the "That page number is less than 1" error
         with self.assertRaisesMessage(EmptyPage, 'That page contains no results'):
             get_page(2, [], 10, allow_empty_first_page=False)
+
+
+class GetPageQuerySetTestCase(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        
+        user = get_user_model().objects.create_user('test')
+        
+        # Insert all records in a single query
+        AuditableTest.objects.bulk_create([AuditableTest() for _ in range(23)], _user=user)
+        
+        cls.pks = list(AuditableTest.objects.order_by('pk').values_list('pk', flat=True))
+    
+    def test_queryset(self):
+        
+        queryset = AuditableTest.objects.order_by('pk')
+        
+        # Queries include the COUNT for the paginator and the page's records
+        with self.assertNumQueries(2):
+            page = get_page(2, queryset, 10)
+            records = list(page)
+        
+        self.assertEqual(page.number, 2)
+        self.assertEqual([r.pk for r in records], self.pks[10:20])
+        self.assertEqual(page.paginator.count, 23)
+        self.assertEqual(page.paginator.num_pages, 3)
+    
+    def test_queryset__page__large(self):
+        
+        page = get_page(10000, AuditableTest.objects.order_by('pk'), 10)
+        
+        self.assertEqual(page.number, 3)
+        self.assertEqual([r.pk for r in page], self.pks[20:])
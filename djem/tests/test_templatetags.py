@@ -10,6 +10,8 @@ from djem.utils.tests import TemplateRendererMixin
 
 from .models import AuditableTest
 
+User = get_user_model()
+
 
 @override_settings(AUTHENTICATION_BACKENDS=[
     'django.contrib.auth.backends.ModelBackend',
@@ -19,7 +21,7 @@ class PermTagTestCase(TemplateRendererMixin, TestCase):
     
     def setUp(self):
         
-        user = get_user_model().objects.create_user('test', 'fakepassword')
+        user = User.objects.create_user('test', 'fakepassword')
         
         # Grant the user all permissions for AuditableTest to ensure the tests
         # focus on object-level permissions
@@ -185,7 +187,7 @@ class IfPermTestCase(PermTagTestCase):
         an object.
         """
         
-        other_user = get_user_model().objects.create_user('other', 'fakepassword')
+        other_user = User.objects.create_user('other', 'fakepassword')
         obj = AuditableTest()
         obj.save(other_user)
         
@@ -210,7 +212,7 @@ class IfPermTestCase(PermTagTestCase):
         defined, when a user does not have a permission on an object.
         """
         
-        other_user = get_user_model().objects.create_user('other', 'fakepassword')
+        other_user = User.objects.create_user('other', 'fakepassword')
         obj = AuditableTest()
         obj.save(other_user)
         
@@ -543,7 +545,7 @@ class IfNotPermTestCase(PermTagTestCase):
         an object.
         """
         
-        other_user = get_user_model().objects.create_user('other', 'fakepassword')
+        other_user = User.objects.create_user('other', 'fakepassword')
         obj = AuditableTest()
         obj.save(other_user)
         
@@ -569,7 +571,7 @@ class IfNotPermTestCase(PermTagTestCase):
         an object.
         """
         
-        other_user = get_user_model().objects.create_user('other', 'fakepassword')
+        other_user = User.objects.create_user('other', 'fakepassword')
         obj = AuditableTest()
         obj.save(other_user)
         
@@ -816,7 +818,7 @@ class PaginateTestCase(TemplateRendererMixin, TestCase):
     @classmethod
     def setUpTestData(cls):
         
-        user = get_user_model().objects.create_user('test')
+        user = User.objects.create_user('test')
         
         for i in range(23):
             AuditableTest().save(user)
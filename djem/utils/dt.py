@@ -441,6 +441,9 @@ TIMEZONE_CHOICES = [(tz, tz) for tz in [
     'UTC'
 ]]
 
+# The names of the above timezones, for efficient membership tests
+TIMEZONE_NAMES = frozenset(tz for tz, _ in TIMEZONE_CHOICES)
+
 
 class TimeZoneHelper:
     
@@ -38,6 +38,9 @@ TEMPLATES = [{
 
 DEFAULT_AUTO_FIELD = 'django.db.models.AutoField'  # suppress system check warning
 
+# Tests have no need for secure password hashes, use a fast hasher instead
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # Add django-extensions to INSTALLED_APPS if it is present. This provides extra
 # dev tools, e.g. shell_plus, but isn't required - e.g. for testing.
 try: